@@ -7,22 +7,56 @@ Just one more thing... this script helps you find what changed in your database.
 
 Usage:
     First run:  python columbo.py path/to/book.gnucash
-                Creates snapshot_before.json
+                Creates snapshot_before.msgpack (or .json)
     
     Second run: python columbo.py path/to/book.gnucash
-                Creates snapshot_after.json and shows what changed
+                Creates snapshot_after.msgpack (or .json) and shows what changed
     
-    Reset:      Delete snapshot_before.json to start over
+    Reset:      Delete the snapshot_before file to start over
+
+Snapshots are stored as compact msgpack (snapshot_before.msgpack) when the
+msgpack package is installed. Pass --json to create JSON snapshots instead;
+an existing snapshot_before.json is always picked up in its own format.
+
+Pass --cache to keep the parsed before snapshot in a snapshot_before.*.pkl
+file, so repeated comparisons against it skip parsing. The cache is
+unpickled when read, so only use --cache in a directory nobody else can
+write to.
 """
 
 import json
 import logging
+import os
+import hashlib
+import pickle
+import sqlite3
 import sys
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
+from itertools import groupby, repeat
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - fall back to the stdlib encoder when it isn't installed
+    orjson = None
+
+try:
+    import piecash
+    from sqlalchemy.orm import joinedload, selectinload
+except ImportError:
+    # Only capturing needs piecash; capture() reports it missing
+    piecash = None
+
+try:
+    import msgpack
+except ImportError:
+    # msgpack is optional - without it new snapshots are written as JSON
+    msgpack = None
 
 # Configure logging
 logging.basicConfig(
@@ -32,8 +66,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Books with fewer transactions are captured in-process: below this size the
+# cost of starting worker processes (each one imports piecash and opens the
+# book) outweighs what they save
+PARALLEL_CAPTURE_THRESHOLD = 20000
+
+MSGPACK_SUFFIX = ".msgpack"
+
+# Bump when the snapshot classes change so stale pickled caches are ignored
+SNAPSHOT_CACHE_VERSION = 3
+
+# Changed transactions are re-read in batches of this many GUIDs, below
+# SQLite's default limit on bound parameters per statement
+GUID_BATCH_SIZE = 900
+
+
+def _require_msgpack():
+    """Return the msgpack module, or raise if it isn't installed."""
+    if msgpack is None:
+        raise ImportError(
+            "msgpack is required to read or write .msgpack snapshots. "
+            "Install with: pip install msgpack"
+        )
+    return msgpack
+
+
+def _json_bytes(value) -> bytes:
+    """Encode a single JSON value, using orjson when it is installed."""
+    if orjson is not None:
+        # orjson doesn't encode NamedTuples itself; write them as plain arrays
+        return orjson.dumps(value, default=tuple)
+    return json.dumps(value).encode('utf-8')
+
+
+def _snapshot_suffix(force_json: bool) -> str:
+    """
+    Pick the file suffix for the before/after snapshots.
+    
+    An existing before snapshot keeps its own format so an investigation
+    started with an older version of this script can still be finished.
+    
+    Args:
+        force_json: True when --json was given on the command line.
+        
+    Returns:
+        ".json" or ".msgpack".
+    """
+    for suffix in (".json", MSGPACK_SUFFIX):
+        if Path(f"snapshot_before{suffix}").exists():
+            return suffix
+    
+    if force_json or msgpack is None:
+        return ".json"
+    return MSGPACK_SUFFIX
+
+
+class SplitRecord(NamedTuple):
+    """
+    Snapshot of a single split.
+    
+    A tuple instead of a dict: transactions hold many splits, and a tuple
+    costs a fraction of a dict's memory. Saved files store each split as a
+    plain array in SplitRecord._fields order. A split that couldn't be read
+    has only its error set.
+    """
+    
+    account_guid: Optional[str] = None
+    account_name: Optional[str] = None
+    value: Optional[float] = None
+    quantity: Optional[float] = None
+    memo: Optional[str] = None
+    reconcile_state: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _split_records(rows: list, fields: Optional[list]) -> list[SplitRecord]:
+    """
+    Rebuild SplitRecords from a saved snapshot.
+    
+    Args:
+        rows: Saved splits - arrays of values, or dicts in older snapshots.
+        fields: Field names the arrays were saved with, or None for dicts.
+        
+    Returns:
+        List of SplitRecord.
+    """
+    if fields is not None and tuple(fields) == SplitRecord._fields:
+        return [SplitRecord._make(row) for row in rows]
+    
+    records = []
+    for row in rows:
+        values = row if fields is None else dict(zip(fields, row))
+        records.append(SplitRecord(**{name: values.get(name) for name in SplitRecord._fields}))
+    return records
+
 
-@dataclass
+@dataclass(slots=True)
 class TransactionSnapshot:
     """Snapshot of a single transaction's state."""
     
@@ -42,15 +170,28 @@ class TransactionSnapshot:
     post_date: Optional[str]
     enter_date: Optional[str]
     split_count: int
-    splits: list[dict]
+    splits: list[SplitRecord]
     error: Optional[str] = None
+    # Hash of the transaction's raw database rows; not part of the comparison
+    row_hash: Optional[str] = field(default=None, compare=False)
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Built by hand: asdict() would deep-copy every leaf and turn each
+        # SplitRecord into a dict; the tuples are returned as is and saved as arrays
+        return {
+            "guid": self.guid,
+            "description": self.description,
+            "post_date": self.post_date,
+            "enter_date": self.enter_date,
+            "split_count": self.split_count,
+            "splits": self.splits,
+            "error": self.error,
+            "row_hash": self.row_hash,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountSnapshot:
     """Snapshot of a single account's state."""
     
@@ -63,7 +204,280 @@ class AccountSnapshot:
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "guid": self.guid,
+            "full_name": self.full_name,
+            "type": self.type,
+            "commodity_symbol": self.commodity_symbol,
+            "parent_guid": self.parent_guid,
+            "balance": self.balance,
+        }
+
+
+def _load_accounts(book) -> list:
+    """
+    Load every account with its commodity in a single query.
+    
+    Iterating book.accounts lazy-loads each account's commodity (and parent)
+    with its own SELECT. Loading them all at once lets parent lookups and
+    fullname walks resolve from the session's identity map instead.
+    """
+    return (
+        book.session.query(piecash.Account)
+        .filter(piecash.Account.parent != None)  # noqa: E711 - same filter as book.accounts
+        .options(joinedload(piecash.Account.commodity))
+        .all()
+    )
+
+
+def _account_full_names(accounts: list) -> dict[str, str]:
+    """
+    Build the colon-separated full name of every account, memoized by GUID.
+    
+    Account.fullname walks all the way up to the root for each account, so
+    siblings re-walk the ancestry they share; here each ancestor's name is
+    built once. Matches Account.fullname, under which the root account's
+    name is empty.
+    
+    Args:
+        accounts: piecash accounts to name.
+        
+    Returns:
+        Dict of account GUID to full name, covering their ancestors too.
+    """
+    full_names: dict[str, str] = {}
+    
+    def full_name(account) -> str:
+        name = full_names.get(account.guid)
+        if name is None:
+            parent = account.parent
+            if parent is None:
+                name = ""
+            else:
+                parent_name = full_name(parent)
+                name = f"{parent_name}:{account.name}" if parent_name else account.name
+            full_names[account.guid] = name
+        return name
+    
+    for account in accounts:
+        full_name(account)
+    return full_names
+
+
+def _load_transactions(book, guid_range: Optional[tuple] = None,
+                       guids: Optional[list] = None) -> list:
+    """
+    Load transactions with their splits and split accounts in a few queries.
+    
+    Falls back to piecash's lazy per-transaction loading if the batched load
+    fails: one split with an unreadable field (e.g. an empty reconcile_date)
+    aborts the whole batch, while lazy loading confines the error to the
+    transaction that owns it so it can be recorded in the snapshot.
+    
+    Args:
+        book: Open piecash book.
+        guid_range: Optional (low, high) GUID bounds, low inclusive and high
+                    exclusive; either bound may be None for an open end.
+        guids: Optional list of specific transaction GUIDs to load.
+    """
+    query = book.session.query(piecash.Transaction)
+    if guid_range is not None:
+        low, high = guid_range
+        if low is not None:
+            query = query.filter(piecash.Transaction.guid >= low)
+        if high is not None:
+            query = query.filter(piecash.Transaction.guid < high)
+    if guids is not None:
+        query = query.filter(piecash.Transaction.guid.in_(guids))
+    
+    try:
+        return query.options(
+            selectinload(piecash.Transaction.splits).joinedload(piecash.Split.account)
+        ).all()
+    except Exception as e:
+        logger.warning(f"Batched transaction load failed ({e}); loading one at a time")
+        return query
+
+
+def _format_timestamp(value) -> str:
+    """
+    Format a piecash date or datetime as "YYYY-MM-DD HH:MM:SS".
+    
+    Produces the same text as strftime("%Y-%m-%d %H:%M:%S") so snapshots
+    stay comparable with older ones, but uses isoformat, which is much
+    cheaper. piecash returns post_date as a plain date (midnight) and
+    enter_date as a timezone-aware datetime, whose UTC offset is dropped.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ', timespec='seconds')[:19]
+    return f"{value.isoformat()} 00:00:00"
+
+
+def _gnc_float(num: Optional[int], denom: int) -> Optional[float]:
+    """
+    Convert a GnuCash numeric, stored as integer numerator/denominator
+    columns, to a float.
+    
+    piecash's value/quantity properties build a Decimal from these columns
+    on every access; dividing the integers directly gives the same
+    correctly rounded float without that detour.
+    """
+    if num is None:
+        return None
+    return num / denom
+
+
+def _snapshot_transaction(transaction) -> TransactionSnapshot:
+    """
+    Build a TransactionSnapshot, recording unreadable fields in its error.
+    
+    Raises:
+        Exception: If even the GUID or description can't be read.
+    """
+    trans_guid = transaction.guid
+    trans_desc = transaction.description if transaction.description else ""
+    
+    # Try to get dates
+    post_date = None
+    enter_date = None
+    error = None
+    
+    try:
+        post_value = transaction.post_date
+        post_date = _format_timestamp(post_value) if post_value else None
+    except Exception as e:
+        error = f"post_date: {str(e)}"
+    
+    try:
+        enter_value = getattr(transaction, 'enter_date', None)
+        enter_date = _format_timestamp(enter_value) if enter_value else None
+    except Exception as e:
+        if error:
+            error += f"; enter_date: {str(e)}"
+        else:
+            error = f"enter_date: {str(e)}"
+    
+    # Try to get splits
+    splits = []
+    split_count = 0
+    try:
+        for split in transaction.splits:
+            split_count += 1
+            try:
+                account = split.account
+                splits.append(SplitRecord(
+                    account_guid=account.guid if account else None,
+                    account_name=account.name if account else None,
+                    value=_gnc_float(split._value_num, split._value_denom),
+                    quantity=_gnc_float(split._quantity_num, split._quantity_denom),
+                    memo=split.memo if split.memo else None,
+                    reconcile_state=split.reconcile_state if hasattr(split, 'reconcile_state') else None
+                ))
+            except Exception as e:
+                splits.append(SplitRecord(error=f"Error reading split: {str(e)}"))
+    except Exception as e:
+        error = f"splits: {str(e)}" if not error else f"{error}; splits: {str(e)}"
+    
+    return TransactionSnapshot(
+        guid=trans_guid,
+        description=trans_desc,
+        post_date=post_date,
+        enter_date=enter_date,
+        split_count=split_count,
+        splits=splits,
+        error=error
+    )
+
+
+def _capture_transactions(book, guid_range: Optional[tuple] = None,
+                          guids: Optional[list] = None) -> tuple[list, int]:
+    """
+    Snapshot the transactions of an open book, optionally one GUID range or
+    an explicit list of GUIDs only.
+    
+    Returns:
+        Tuple of (TransactionSnapshot list, count of transactions too
+        damaged to snapshot at all).
+    """
+    trans_snapshots = []
+    unreadable_count = 0
+    
+    for transaction in _load_transactions(book, guid_range, guids):
+        try:
+            trans_snapshots.append(_snapshot_transaction(transaction))
+        except Exception as e:
+            logger.error(f"Error capturing transaction: {e}")
+            unreadable_count += 1
+    
+    return trans_snapshots, unreadable_count
+
+
+def _capture_transaction_range(book_path: str, guid_range: tuple) -> tuple[list, int]:
+    """Worker process entry point: open the book and capture one GUID range."""
+    book = piecash.open_book(book_path, readonly=True, do_backup=False)
+    try:
+        return _capture_transactions(book, guid_range)
+    finally:
+        book.close()
+
+
+def _transaction_row_hashes(book_path: Path) -> Optional[dict[str, str]]:
+    """
+    Hash each transaction's raw rows straight from the SQLite book.
+    
+    The hash covers every column of the transaction, of its splits and the
+    names of the split accounts - everything a TransactionSnapshot is built
+    from - so an unchanged hash means re-reading the transaction through
+    piecash would produce the same snapshot. Reading the rows with plain SQL
+    is far cheaper than materializing them as ORM objects.
+    
+    GnuCash does not touch enter_date when a transaction is edited, and
+    external utilities rewrite rows in place, so dates can't be used to
+    find what changed.
+    
+    Args:
+        book_path: Path to GnuCash book file.
+        
+    Returns:
+        Dict of transaction GUID to hex digest, or None if the book couldn't
+        be read this way.
+    """
+    query = """
+        SELECT t.guid, t.currency_guid, t.num, t.post_date, t.enter_date, t.description,
+               s.guid, s.account_guid, a.name, s.memo, s.action,
+               s.reconcile_state, s.reconcile_date, s.value_num, s.value_denom,
+               s.quantity_num, s.quantity_denom, s.lot_guid
+        FROM transactions t
+        LEFT JOIN splits s ON s.tx_guid = t.guid
+        LEFT JOIN accounts a ON a.guid = s.account_guid
+        ORDER BY t.guid, s.guid
+    """
+    try:
+        conn = sqlite3.connect(f"{Path(book_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row_hashes = {}
+            for guid, rows in groupby(conn.execute(query), key=lambda row: row[0]):
+                hasher = hashlib.blake2b(digest_size=16)
+                for row in rows:
+                    hasher.update(repr(row[1:]).encode('utf-8'))
+                row_hashes[guid] = hasher.hexdigest()
+            return row_hashes
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not hash transaction rows ({e}); capturing every transaction")
+        return None
+
+
+def _guid_ranges(partitions: int) -> list[tuple]:
+    """
+    Split the hex GUID space into contiguous (low, high) ranges.
+    
+    Bounds are two-character hex prefixes; the outer ends are left open so
+    every GUID falls into exactly one range.
+    """
+    bounds = [None] + [f"{(256 * i) // partitions:02x}" for i in range(1, partitions)] + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
 
 
 class DatabaseSnapshot:
@@ -80,19 +494,23 @@ class DatabaseSnapshot:
         }
     
     @classmethod
-    def capture(cls, book_path: Path) -> "DatabaseSnapshot":
+    def capture(cls, book_path: Path, previous: Optional["DatabaseSnapshot"] = None) -> "DatabaseSnapshot":
         """
         Capture a snapshot of the database.
         
+        Every transaction is stamped with a hash of its raw database rows.
+        When a previous snapshot is given, transactions whose hash is
+        unchanged are carried over from it and only the rest are read
+        through piecash.
+        
         Args:
             book_path: Path to GnuCash book file.
+            previous: Optional earlier snapshot of the same book.
             
         Returns:
             DatabaseSnapshot with all accounts and transactions.
         """
-        try:
-            import piecash
-        except ImportError:
+        if piecash is None:
             logger.error("piecash library required. Install with: pip install piecash")
             sys.exit(1)
         
@@ -105,15 +523,15 @@ class DatabaseSnapshot:
         try:
             # Capture accounts
             logger.info("Capturing accounts...")
-            for account in book.accounts:
-                full_name = account.fullname if hasattr(account, 'fullname') else str(account)
-                parent_guid = None
-                if account.parent and account.parent.guid:
-                    parent_guid = str(account.parent.guid)
+            accounts = _load_accounts(book)
+            full_names = _account_full_names(accounts)
+            for account in accounts:
+                parent = account.parent
+                parent_guid = parent.guid if parent else None
                 
-                snapshot.accounts[str(account.guid)] = AccountSnapshot(
-                    guid=str(account.guid),
-                    full_name=full_name,
+                snapshot.accounts[account.guid] = AccountSnapshot(
+                    guid=account.guid,
+                    full_name=full_names[account.guid],
                     type=account.type,
                     commodity_symbol=account.commodity.mnemonic,
                     parent_guid=parent_guid
@@ -127,67 +545,47 @@ class DatabaseSnapshot:
             error_count = 0
             success_count = 0
             
-            for transaction in book.transactions:
-                try:
-                    trans_guid = str(transaction.guid)
-                    trans_desc = transaction.description if transaction.description else ""
-                    
-                    # Try to get dates
-                    post_date = None
-                    enter_date = None
-                    error = None
-                    
-                    try:
-                        post_date = transaction.post_date.strftime("%Y-%m-%d %H:%M:%S") if transaction.post_date else None
-                    except Exception as e:
-                        error = f"post_date: {str(e)}"
-                    
-                    try:
-                        enter_date = transaction.enter_date.strftime("%Y-%m-%d %H:%M:%S") if hasattr(transaction, 'enter_date') and transaction.enter_date else None
-                    except Exception as e:
-                        if error:
-                            error += f"; enter_date: {str(e)}"
-                        else:
-                            error = f"enter_date: {str(e)}"
-                    
-                    # Try to get splits
-                    splits = []
-                    split_count = 0
-                    try:
-                        for split in transaction.splits:
-                            split_count += 1
-                            try:
-                                splits.append({
-                                    "account_guid": str(split.account.guid) if split.account else None,
-                                    "account_name": split.account.name if split.account else None,
-                                    "value": float(split.value) if split.value is not None else None,
-                                    "quantity": float(split.quantity) if split.quantity is not None else None,
-                                    "memo": split.memo if split.memo else None,
-                                    "reconcile_state": split.reconcile_state if hasattr(split, 'reconcile_state') else None
-                                })
-                            except Exception as e:
-                                splits.append({"error": f"Error reading split: {str(e)}"})
-                    except Exception as e:
-                        error = f"splits: {str(e)}" if not error else f"{error}; splits: {str(e)}"
-                    
-                    snapshot.transactions[trans_guid] = TransactionSnapshot(
-                        guid=trans_guid,
-                        description=trans_desc,
-                        post_date=post_date,
-                        enter_date=enter_date,
-                        split_count=split_count,
-                        splits=splits,
-                        error=error
-                    )
-                    
-                    if error:
+            row_hashes = _transaction_row_hashes(book_path)
+            unchanged = {}
+            if previous is not None and row_hashes is not None:
+                for guid, row_hash in row_hashes.items():
+                    prior = previous.transactions.get(guid)
+                    if prior is not None and prior.row_hash == row_hash:
+                        unchanged[guid] = prior
+            
+            transaction_total = book.session.query(piecash.Transaction).count()
+            workers = os.cpu_count() or 1
+            if unchanged:
+                changed = [guid for guid in row_hashes if guid not in unchanged]
+                logger.info(f"Reusing {len(unchanged)} unchanged transactions, capturing {len(changed)}")
+                results = [(list(unchanged.values()), 0)]
+                for start in range(0, len(changed), GUID_BATCH_SIZE):
+                    results.append(_capture_transactions(book, guids=changed[start:start + GUID_BATCH_SIZE]))
+            elif transaction_total >= PARALLEL_CAPTURE_THRESHOLD and workers > 1:
+                # Each worker opens the book itself: piecash objects are bound
+                # to this process's session and can't be sent to another
+                logger.info(f"Capturing {transaction_total} transactions in {workers} processes")
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(
+                        _capture_transaction_range,
+                        repeat(str(book_path)),
+                        _guid_ranges(workers)
+                    ))
+            else:
+                results = [_capture_transactions(book)]
+            
+            for trans_snapshots, unreadable_count in results:
+                error_count += unreadable_count
+                for trans_snapshot in trans_snapshots:
+                    snapshot.transactions[trans_snapshot.guid] = trans_snapshot
+                    if trans_snapshot.error:
                         error_count += 1
                     else:
                         success_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error capturing transaction: {e}")
-                    error_count += 1
+            
+            if row_hashes is not None:
+                for guid, trans_snapshot in snapshot.transactions.items():
+                    trans_snapshot.row_hash = row_hashes.get(guid)
             
             snapshot.metadata["transaction_count"] = len(snapshot.transactions)
             snapshot.metadata["error_count"] = error_count
@@ -199,24 +597,82 @@ class DatabaseSnapshot:
         return snapshot
     
     def save(self, filepath: Path) -> None:
-        """Save snapshot to JSON file."""
-        data = {
-            "timestamp": self.timestamp,
-            "metadata": self.metadata,
-            "accounts": {guid: acc.to_dict() for guid, acc in self.accounts.items()},
-            "transactions": {guid: trans.to_dict() for guid, trans in self.transactions.items()}
+        """
+        Save snapshot to file (msgpack for .msgpack paths, otherwise JSON).
+        
+        Records are encoded and written one at a time instead of first being
+        collected into a single document, so saving needs no memory beyond
+        the snapshot itself.
+        """
+        sections = {
+            "accounts": self.accounts,
+            "transactions": self.transactions,
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if Path(filepath).suffix == MSGPACK_SUFFIX:
+            packer = _require_msgpack().Packer(use_bin_type=True)
+            with open(filepath, 'wb') as f:
+                f.write(packer.pack_map_header(3 + len(sections)))
+                f.write(packer.pack("timestamp") + packer.pack(self.timestamp))
+                f.write(packer.pack("metadata") + packer.pack(self.metadata))
+                f.write(packer.pack("split_fields") + packer.pack(SplitRecord._fields))
+                for name, records in sections.items():
+                    f.write(packer.pack(name) + packer.pack_map_header(len(records)))
+                    for guid, record in records.items():
+                        f.write(packer.pack(guid) + packer.pack(record.to_dict()))
+        else:
+            # One record per line keeps the file greppable
+            with open(filepath, 'wb') as f:
+                f.write(b'{"timestamp": ' + _json_bytes(self.timestamp))
+                f.write(b',\n"metadata": ' + _json_bytes(self.metadata))
+                f.write(b',\n"split_fields": ' + _json_bytes(SplitRecord._fields))
+                for name, records in sections.items():
+                    f.write(b',\n' + _json_bytes(name) + b': {')
+                    separator = b'\n'
+                    for guid, record in records.items():
+                        f.write(separator + _json_bytes(guid) + b': ' + _json_bytes(record.to_dict()))
+                        separator = b',\n'
+                    f.write(b'\n}')
+                f.write(b'}\n')
         
         logger.info(f"Snapshot saved to {filepath}")
     
     @classmethod
-    def load(cls, filepath: Path) -> "DatabaseSnapshot":
-        """Load snapshot from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def load(cls, filepath: Path, use_cache: bool = False) -> "DatabaseSnapshot":
+        """
+        Load snapshot from file (msgpack for .msgpack paths, otherwise JSON).
+        
+        With use_cache, the parsed snapshot is also pickled to a "<file>.pkl"
+        sidecar keyed on the file's mtime and size, so re-running the
+        comparison against the same before snapshot skips parsing it again.
+        Unpickling runs code from the sidecar, so the cache is opt-in. A
+        stale or unreadable sidecar is ignored and the file is parsed.
+        """
+        filepath = Path(filepath)
+        stat = filepath.stat()
+        cache_key = (SNAPSHOT_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        cache_file = filepath.with_name(filepath.name + ".pkl")
+        
+        if use_cache:
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached_key, cached_snapshot = pickle.load(f)
+                # Run as a script vs imported, the pickled classes differ
+                if cached_key == cache_key and isinstance(cached_snapshot, cls):
+                    logger.info(f"Snapshot loaded from {filepath} (cached)")
+                    return cached_snapshot
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable snapshot cache {cache_file}: {e}")
+        
+        if filepath.suffix == MSGPACK_SUFFIX:
+            data = _require_msgpack().unpackb(filepath.read_bytes(), raw=False)
+        elif orjson is not None:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         snapshot = cls()
         snapshot.timestamp = data["timestamp"]
@@ -225,13 +681,45 @@ class DatabaseSnapshot:
         for guid, acc_data in data["accounts"].items():
             snapshot.accounts[guid] = AccountSnapshot(**acc_data)
         
+        # Snapshots saved before splits became SplitRecords have no header
+        split_fields = data.get("split_fields")
         for guid, trans_data in data["transactions"].items():
+            trans_data["splits"] = _split_records(trans_data["splits"], split_fields)
             snapshot.transactions[guid] = TransactionSnapshot(**trans_data)
         
+        if use_cache:
+            try:
+                with open(cache_file, 'wb') as f:
+                    pickle.dump((cache_key, snapshot), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.debug(f"Could not write snapshot cache {cache_file}: {e}")
+        
         logger.info(f"Snapshot loaded from {filepath}")
         return snapshot
 
 
+def _partition_guids(before: dict, after: dict) -> tuple[list, list, list]:
+    """
+    Split the GUID keys of two snapshot dicts into added, removed and common.
+    
+    Each dict is walked once and every key is classified with a single
+    membership test against the other dict, so no intermediate key sets
+    are built. Results keep the dicts' insertion order.
+    
+    Returns:
+        Tuple of (added, removed, common) GUID lists.
+    """
+    removed = []
+    common = []
+    for guid in before:
+        if guid in after:
+            common.append(guid)
+        else:
+            removed.append(guid)
+    added = [guid for guid in after if guid not in before]
+    return added, removed, common
+
+
 def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict:
     """Compare two snapshots and identify changes."""
     logger.info("Comparing snapshots")
@@ -255,67 +743,72 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
     }
     
     # Compare accounts
-    before_guids = set(before.accounts.keys())
-    after_guids = set(after.accounts.keys())
+    added_guids, removed_guids, common_guids = _partition_guids(before.accounts, after.accounts)
     
-    for guid in (after_guids - before_guids):
+    for guid in added_guids:
         changes["accounts"]["added"].append(after.accounts[guid].to_dict())
     
-    for guid in (before_guids - after_guids):
+    for guid in removed_guids:
         changes["accounts"]["removed"].append(before.accounts[guid].to_dict())
     
-    for guid in (before_guids & after_guids):
-        if before.accounts[guid].to_dict() != after.accounts[guid].to_dict():
+    for guid in common_guids:
+        before_acc = before.accounts[guid]
+        after_acc = after.accounts[guid]
+        # Dataclass equality compares the same fields to_dict() emits, so
+        # unchanged accounts are skipped without building any dicts
+        if before_acc != after_acc:
             changes["accounts"]["modified"].append({
                 "guid": guid,
-                "before": before.accounts[guid].to_dict(),
-                "after": after.accounts[guid].to_dict()
+                "before": before_acc.to_dict(),
+                "after": after_acc.to_dict()
             })
     
     # Compare transactions
-    before_trans = set(before.transactions.keys())
-    after_trans = set(after.transactions.keys())
+    added_trans, removed_trans, common_trans = _partition_guids(before.transactions, after.transactions)
     
-    for guid in (after_trans - before_trans):
-        trans = after.transactions[guid]
-        # Check if this is replacing a removed transaction (same description)
-        is_replacement = False
-        for removed_guid in (before_trans - after_trans):
-            if before.transactions[removed_guid].description == trans.description:
-                is_replacement = True
-                break
-        
-        if is_replacement and trans.error is None:
-            # This looks like a fix - new transaction replaced bad one
-            pass  # Will be caught in fixed section
-        
-        changes["transactions"]["added"].append(trans.to_dict())
+    # Added/removed records may be reported twice (as a recreated fix too),
+    # so convert them to dicts once up front
+    added_dicts = {guid: after.transactions[guid].to_dict() for guid in added_trans}
+    removed_dicts = {guid: before.transactions[guid].to_dict() for guid in removed_trans}
+    
+    # Index added transactions by description so replacement detection is a
+    # dict lookup instead of a scan of every added transaction per removal
+    added_by_desc: dict[str, str] = {}
+    for guid in added_trans:
+        added_by_desc.setdefault(after.transactions[guid].description, guid)
+    
+    for guid in added_trans:
+        changes["transactions"]["added"].append(added_dicts[guid])
     
-    for guid in (before_trans - after_trans):
+    for guid in removed_trans:
         trans = before.transactions[guid]
-        # Check if this was replaced by a new transaction
-        was_replaced = False
-        for added_guid in (after_trans - before_trans):
-            if after.transactions[added_guid].description == trans.description:
-                was_replaced = True
-                # Check if it was a fix
-                if trans.error and not after.transactions[added_guid].error:
-                    changes["transactions"]["fixed"].append({
-                        "old_guid": guid,
-                        "new_guid": added_guid,
-                        "description": trans.description,
-                        "before": trans.to_dict(),
-                        "after": after.transactions[added_guid].to_dict(),
-                        "fix_type": "recreated"
-                    })
-                break
-        
-        changes["transactions"]["removed"].append(trans.to_dict())
-    
-    for guid in (before_trans & after_trans):
+        # Check if this was replaced by a new transaction (same description)
+        added_guid = added_by_desc.get(trans.description)
+        if added_guid is not None:
+            # Check if it was a fix - new transaction replaced bad one
+            if trans.error and not after.transactions[added_guid].error:
+                changes["transactions"]["fixed"].append({
+                    "old_guid": guid,
+                    "new_guid": added_guid,
+                    "description": trans.description,
+                    "before": removed_dicts[guid],
+                    "after": added_dicts[added_guid],
+                    "fix_type": "recreated"
+                })
+        
+        changes["transactions"]["removed"].append(removed_dicts[guid])
+    
+    for guid in common_trans:
         before_t = before.transactions[guid]
         after_t = after.transactions[guid]
         
+        # Unchanged transactions can't be fixed, broken, or modified
+        if before_t == after_t:
+            continue
+        
+        before_dict = before_t.to_dict()
+        after_dict = after_t.to_dict()
+        
         before_had_error = before_t.error is not None
         after_has_error = after_t.error is not None
         
@@ -323,23 +816,23 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
             changes["transactions"]["fixed"].append({
                 "guid": guid,
                 "description": after_t.description,
-                "before": before_t.to_dict(),
-                "after": after_t.to_dict(),
+                "before": before_dict,
+                "after": after_dict,
                 "fix_type": "in-place"
             })
         elif not before_had_error and after_has_error:
             changes["transactions"]["broken"].append({
                 "guid": guid,
                 "description": after_t.description,
-                "before": before_t.to_dict(),
-                "after": after_t.to_dict()
+                "before": before_dict,
+                "after": after_dict
             })
-        elif before_t.to_dict() != after_t.to_dict():
+        else:
             changes["transactions"]["modified"].append({
                 "guid": guid,
                 "description": after_t.description,
-                "before": before_t.to_dict(),
-                "after": after_t.to_dict()
+                "before": before_dict,
+                "after": after_dict
             })
     
     changes["summary"] = {
@@ -356,6 +849,19 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
     return changes
 
 
+def _positive_split_total(splits: list[SplitRecord]):
+    """
+    Sum the positive split values of a transaction in a single pass.
+    
+    Unreadable splits and splits without a value are skipped.
+    """
+    total = 0
+    for split in splits:
+        if split.error is None and split.value is not None and split.value > 0:
+            total += split.value
+    return total
+
+
 def format_comparison_text(changes: dict) -> str:
     """Format comparison as human-readable text."""
     lines = []
@@ -412,8 +918,8 @@ def format_comparison_text(changes: dict) -> str:
             if after['splits']:
                 lines.append(f"     Split details:")
                 for split in after['splits']:
-                    if 'error' not in split:
-                        lines.append(f"       - {split['account_name']}: ${split['value']}")
+                    if split.error is None:
+                        lines.append(f"       - {split.account_name}: ${split.value}")
             lines.append("")
     
     # Broken transactions
@@ -428,13 +934,16 @@ def format_comparison_text(changes: dict) -> str:
             lines.append(f"   WAS WORKING, NOW HAS ERROR: {broken['after']['error']}")
             lines.append("")
     
+    # Descriptions of transactions recreated as fixes; their added/removed
+    # halves are already reported above
+    recreated_descs = {
+        f['description'] for f in changes["transactions"]["fixed"]
+        if f.get('fix_type') == 'recreated'
+    }
+    
     # Added transactions (not counted as fixes)
-    new_good = [t for t in changes["transactions"]["added"] 
-                if t['error'] is None and not any(
-                    f['description'] == t['description'] 
-                    for f in changes["transactions"]["fixed"] 
-                    if f.get('fix_type') == 'recreated'
-                )]
+    new_good = [t for t in changes["transactions"]["added"]
+                if t['error'] is None and t['description'] not in recreated_descs]
     
     if new_good:
         lines.append("=" * 80)
@@ -442,16 +951,13 @@ def format_comparison_text(changes: dict) -> str:
         lines.append("=" * 80)
         lines.append("")
         for i, trans in enumerate(new_good, 1):
-            lines.append(f"{i}. {trans['description']} - {trans['post_date']} (${sum(s.get('value', 0) for s in trans['splits'] if 'error' not in s and s.get('value', 0) > 0)})")
+            total = _positive_split_total(trans['splits'])
+            lines.append(f"{i}. {trans['description']} - {trans['post_date']} (${total})")
         lines.append("")
     
     # Removed transactions (not part of fixes)
     removed_bad = [t for t in changes["transactions"]["removed"]
-                   if not any(
-                       f['description'] == t['description']
-                       for f in changes["transactions"]["fixed"]
-                       if f.get('fix_type') == 'recreated'
-                   )]
+                   if t['description'] not in recreated_descs]
     
     if removed_bad:
         lines.append("=" * 80)
@@ -499,19 +1005,25 @@ def format_comparison_text(changes: dict) -> str:
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
+    flags = {"--json", "--cache"}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    force_json = "--json" in sys.argv[1:]
+    use_cache = "--cache" in sys.argv[1:]
+    
+    if not args:
         print(__doc__)
         print("\nError: Please provide path to GnuCash book file")
         print("Example: python columbo.py path/to/book.gnucash")
         sys.exit(1)
     
-    book_path = Path(sys.argv[1])
+    book_path = Path(args[0])
     if not book_path.exists():
         logger.error(f"Book file not found: {book_path}")
         sys.exit(1)
     
-    before_file = Path("snapshot_before.json")
-    after_file = Path("snapshot_after.json")
+    suffix = _snapshot_suffix(force_json)
+    before_file = Path(f"snapshot_before{suffix}")
+    after_file = Path(f"snapshot_after{suffix}")
     
     print("=" * 80)
     print("COLUMBO - The GnuCash Database Detective")
@@ -549,8 +1061,8 @@ def main():
         print(f"Found existing snapshot. Creating AFTER snapshot...")
         print()
         
-        before = DatabaseSnapshot.load(before_file)
-        after = DatabaseSnapshot.capture(book_path)
+        before = DatabaseSnapshot.load(before_file, use_cache=use_cache)
+        after = DatabaseSnapshot.capture(book_path, previous=before)
         after.save(after_file)
         
         print()
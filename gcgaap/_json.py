@@ -0,0 +1,56 @@
+"""
+JSON encoding and decoding for GCGAAP.
+
+Uses orjson when it is installed (pip install gcgaap[fast]) and falls
+back to the standard library json module, producing the same document.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, *, indent: bool = False) -> bytes:
+    """
+    Encode a value as UTF-8 JSON.
+
+    Args:
+        obj: JSON-compatible value (dicts, lists, strings, numbers, None).
+        indent: If True, indent nested values by two spaces.
+
+    Returns:
+        The encoded document as bytes (non-ASCII text is not escaped).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def loads(data: bytes):
+    """
+    Decode a UTF-8 JSON document.
+
+    Args:
+        data: The encoded document.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        ValueError: If the document is not valid JSON (both orjson's
+            JSONDecodeError and the standard library's subclass it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,24 @@
+"""
+Shared output helpers for gcgaap command groups.
+"""
+
+import sys
+
+import click
+
+
+def echo_formatted(output: str, format: str) -> None:
+    """
+    Print command output in the requested format.
+
+    CSV and JSON sent to a pipe or file are written as UTF-8 bytes,
+    skipping the text stream's re-encoding and newline translation.
+
+    Args:
+        output: The formatted output text.
+        format: The output format name ("text", "json" or "csv").
+    """
+    if format.lower() != "text" and not sys.stdout.isatty():
+        click.echo(output.encode("utf-8"))
+    else:
+        click.echo(output)
@@ -4,7 +4,8 @@ Database command group for gcgaap.
 Commands: validate, violations, repair-dates, snapshot, diff-snapshots
 """
 
-import json
+import copy
+import functools
 import logging
 import sys
 import warnings
@@ -17,9 +18,6 @@ from ..config import GCGAAPConfig
 from ..entity_map import EntityMap
 from ..gnucash_access import GnuCashBook, parse_date
 from ..validate import validate_book
-from ..violations import generate_violations_report, format_violations_report
-from ..repair import diagnose_empty_reconcile_dates, repair_empty_reconcile_dates
-from ..snapshot import DatabaseSnapshot, compare_snapshots, format_comparison_text
 from ._options import (
     book_file_option,
     entity_map_option,
@@ -27,6 +25,7 @@ from ._options import (
     tolerance_option,
     output_file_option,
 )
+from ._output import echo_formatted
 
 logger = logging.getLogger(__name__)
 
@@ -96,14 +95,14 @@ def validate(book_file, entity_map_file, tolerance, strict, format, quiet):
         with GnuCashBook(book_file) as book:
             result = validate_book(book, entity_map, config, strict_mode=strict, quiet=quiet)
 
-        if format.lower() == "json":
-            output = result.format_as_json()
-        elif format.lower() == "csv":
-            output = result.format_as_csv()
-        else:
-            output = result.format_as_text(strict_mode=strict)
+        formatters = {
+            "csv": result.format_as_csv,
+            "json": result.format_as_json,
+            "text": functools.partial(result.format_as_text, strict_mode=strict),
+        }
+        output = formatters[format.lower()]()
 
-        click.echo(output)
+        echo_formatted(output, format)
 
         sys.exit(1 if result.has_errors else 0)
 
@@ -140,6 +139,8 @@ def violations(book_file, entity_map_file, as_of, tolerance):
     Use this command to identify and prioritize data quality fixes before
     generating financial reports.
     """
+    from ..violations import generate_violations_report, format_violations_report
+
     logger.info("=== GCGAAP Violations Report ===")
 
     try:
@@ -219,11 +220,13 @@ def repair_dates(book_file, diagnose_only, no_backup):
 
     Use --diagnose-only to check for issues without making changes.
     """
+    from ..repair import diagnose_empty_reconcile_dates, repair_empty_reconcile_dates
+
     logger.info("=== GCGAAP Database Repair: Empty Reconcile Dates ===")
 
     try:
         logger.info(f"Analyzing database: {book_file}")
-        count, descriptions = diagnose_empty_reconcile_dates(book_file)
+        count, description_count, descriptions = diagnose_empty_reconcile_dates(book_file)
 
         if count == 0:
             click.echo("\n[OK] No empty reconcile_date fields found.")
@@ -231,11 +234,11 @@ def repair_dates(book_file, diagnose_only, no_backup):
             sys.exit(0)
 
         click.echo(f"\n[!] Found {count} split(s) with empty reconcile_date field")
-        click.echo(f"\nAffected transactions ({len(descriptions)}):")
-        for desc in descriptions[:10]:
+        click.echo(f"\nAffected transactions ({description_count}):")
+        for desc in descriptions:
             click.echo(f"  - {desc}")
-        if len(descriptions) > 10:
-            click.echo(f"  ... and {len(descriptions) - 10} more")
+        if description_count > len(descriptions):
+            click.echo(f"  ... and {description_count - len(descriptions)} more")
 
         click.echo(f"\nThis prevents piecash from reading these transactions.")
         click.echo("Error message: \"Couldn't parse datetime string: ''\"\n")
@@ -298,6 +301,8 @@ def snapshot(book_file, output_file):
 
     Use 'diff-snapshots' command to compare two snapshots and see what changed.
     """
+    from ..snapshot import DatabaseSnapshot
+
     logger.info("=== GCGAAP Database Snapshot ===")
 
     try:
@@ -367,28 +372,45 @@ def diff_snapshots(before_file, after_file, output_file, format):
     3. gcgaap db snapshot -f book.gnucash -o after.json
     4. gcgaap db diff-snapshots -b before.json -a after.json
     """
+    from .._json import dumps as json_dumps
+    from ..snapshot import (
+        DatabaseSnapshot,
+        compare_snapshots,
+        format_comparison_text,
+        read_snapshot_timestamp,
+        snapshot_payloads_identical,
+    )
+
     logger.info("=== GCGAAP Snapshot Comparison ===")
 
     try:
         logger.info(f"Loading before snapshot from {before_file}")
         before = DatabaseSnapshot.load(before_file)
 
-        logger.info(f"Loading after snapshot from {after_file}")
-        after = DatabaseSnapshot.load(after_file)
+        if snapshot_payloads_identical(before_file, after_file):
+            # Only the capture time differs; no need to parse the records twice
+            logger.info(f"After snapshot {after_file} records the same state as before snapshot")
+            after = copy.copy(before)
+            after.timestamp = read_snapshot_timestamp(after_file) or before.timestamp
+        else:
+            logger.info(f"Loading after snapshot from {after_file}")
+            after = DatabaseSnapshot.load(after_file)
 
         changes = compare_snapshots(before, after)
-
-        if format.lower() == "json":
-            output = json.dumps(changes, indent=2)
-        else:
-            output = format_comparison_text(changes)
+        as_json = format.lower() == "json"
 
         if output_file:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(output)
+            if as_json:
+                with open(output_file, "wb") as f:
+                    f.write(json_dumps(changes, indent=True))
+            else:
+                with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.write(format_comparison_text(changes))
             click.echo(f"Comparison saved to: {output_file}")
+        elif as_json:
+            click.echo(json_dumps(changes, indent=True).decode("utf-8"))
         else:
-            click.echo(output)
+            click.echo(format_comparison_text(changes))
 
         summary = changes["summary"]
         if summary["transactions_fixed"] > 0:
@@ -4,21 +4,22 @@ Entity command group for gcgaap.
 Commands: scan, infer, remap
 """
 
-import json
 import logging
 import sys
+from operator import attrgetter
 from pathlib import Path
 
 import click
 
 from ..entity_map import EntityMap
 from ..gnucash_access import GnuCashBook
-from ..validate import scan_unmapped_accounts, check_cross_entity_balancing_accounts
-from ..entity_inference import EntityInferenceEngine, build_entity_map_from_suggestions, merge_entity_maps
 from ._options import book_file_option, entity_map_option, output_file_option
 
 logger = logging.getLogger(__name__)
 
+# Padded confidence bars indexed by tenths (confidence is scored 0.0-1.0)
+_CONFIDENCE_BARS = tuple("█" * i + " " * (10 - i) for i in range(11))
+
 
 @click.group(name="entity")
 def entity_group():
@@ -41,6 +42,8 @@ def scan(book_file, entity_map_file):
     This is useful for identifying accounts that need to be added
     to the entity mapping configuration.
     """
+    from ..validate import scan_unmapped_accounts, check_cross_entity_balancing_accounts
+
     logger.info("=== GCGAAP Entity Scan ===")
 
     try:
@@ -57,60 +60,65 @@ def scan(book_file, entity_map_file):
             click.echo(f"{'GUID':<40} {'Type':<15} {'Currency':<10} {'Full Name'}")
             click.echo("-" * 120)
 
-            for account in unmapped:
-                click.echo(
-                    f"{account.guid:<40} "
-                    f"{account.type:<15} "
-                    f"{account.commodity_symbol:<10} "
-                    f"{account.full_name}"
-                )
+            # One write for the whole table rather than one per account
+            click.echo("\n".join(
+                f"{account.guid:<40} "
+                f"{account.type:<15} "
+                f"{account.commodity_symbol:<10} "
+                f"{account.full_name}"
+                for account in unmapped
+            ))
 
             click.echo(f"\n{len(unmapped)} account(s) need entity mapping.")
             click.echo(f"Edit {entity_map_file} to add mappings for these accounts.")
 
-        click.echo("\n" + "=" * 80)
-        click.echo("CROSS-ENTITY BALANCING ACCOUNT STATUS")
-        click.echo("=" * 80)
-        click.echo()
-
         entities_with_balancing = []
         entities_without_balancing = []
 
-        for entity_key, status in sorted(balancing_status.items(), key=lambda x: x[1].entity_label):
+        for status in balancing_status.values():
             if status.has_balancing_account:
                 entities_with_balancing.append(status)
             else:
                 entities_without_balancing.append(status)
+        entities_with_balancing.sort(key=attrgetter("entity_label"))
+        entities_without_balancing.sort(key=attrgetter("entity_label"))
+
+        # Build the whole section and write it once
+        lines = ["\n" + "=" * 80, "CROSS-ENTITY BALANCING ACCOUNT STATUS", "=" * 80, ""]
 
         if entities_with_balancing:
-            click.echo("[OK] Entities WITH cross-entity balancing accounts:")
-            click.echo()
+            lines.append("[OK] Entities WITH cross-entity balancing accounts:")
+            lines.append("")
             for status in entities_with_balancing:
-                click.echo(f"  [OK] {status.entity_label} ({status.entity_key})")
-                for account_name in status.balancing_accounts:
-                    click.echo(f"      - {account_name}")
-            click.echo()
+                lines.append(f"  [OK] {status.entity_label} ({status.entity_key})")
+                lines.extend(f"      - {account_name}" for account_name in status.balancing_accounts)
+            lines.append("")
 
         if entities_without_balancing:
-            click.echo("[!] Entities WITHOUT cross-entity balancing accounts:")
-            click.echo()
-            for status in entities_without_balancing:
-                click.echo(f"  [!] {status.entity_label} ({status.entity_key})")
-            click.echo()
-            click.echo("Consider creating cross-entity balancing equity accounts for these entities")
-            click.echo("if they participate in cross-entity transactions (e.g., shared credit cards).")
-            click.echo()
-            click.echo("Recommended account names:")
-            click.echo("  - Equity:Cross-Entity Balancing")
-            click.echo("  - Equity:Inter-Entity")
-            click.echo()
-
-        click.echo("=" * 80)
-        click.echo(
+            lines.append("[!] Entities WITHOUT cross-entity balancing accounts:")
+            lines.append("")
+            lines.extend(
+                f"  [!] {status.entity_label} ({status.entity_key})"
+                for status in entities_without_balancing
+            )
+            lines.extend([
+                "",
+                "Consider creating cross-entity balancing equity accounts for these entities",
+                "if they participate in cross-entity transactions (e.g., shared credit cards).",
+                "",
+                "Recommended account names:",
+                "  - Equity:Cross-Entity Balancing",
+                "  - Equity:Inter-Entity",
+                "",
+            ])
+
+        lines.extend([
+            "=" * 80,
             f"Summary: {len(entities_with_balancing)} entities with balancing accounts, "
-            f"{len(entities_without_balancing)} without"
-        )
-        click.echo("=" * 80)
+            f"{len(entities_without_balancing)} without",
+            "=" * 80,
+        ])
+        click.echo("\n".join(lines))
 
         sys.exit(0)
 
@@ -146,6 +154,13 @@ def infer(book_file, entity_map_file, output_file, merge):
     The output can be saved to a new file or merged with an existing
     entity-map.json file.
     """
+    from .._json import dumps as json_dumps
+    from ..entity_inference import (
+        EntityInferenceEngine,
+        build_entity_map_from_suggestions,
+        merge_entity_maps,
+    )
+
     logger.info("=== GCGAAP Smart Entity Inference ===")
 
     try:
@@ -165,27 +180,30 @@ def infer(book_file, entity_map_file, output_file, merge):
         click.echo(f"\n=== Suggested Entities ({len(result.suggestions)}) ===\n")
 
         for i, suggestion in enumerate(result.suggestions, 1):
-            confidence_bar = "█" * int(suggestion.confidence * 10)
-            click.echo(f"{i}. {suggestion.label}")
-            click.echo(f"   Key: {suggestion.key}")
-            click.echo(f"   Type: {suggestion.type}")
-            click.echo(f"   Confidence: [{confidence_bar:<10}] {suggestion.confidence:.1%}")
-            click.echo(f"   Accounts: {suggestion.account_count}")
-            click.echo(f"   Sample accounts:")
-            for sample in suggestion.sample_accounts[:3]:
-                click.echo(f"     - {sample}")
-            click.echo(f"   Suggested patterns:")
-            for pattern in suggestion.suggested_patterns[:3]:
-                click.echo(f"     - {pattern}")
-            if len(suggestion.suggested_patterns) > 3:
-                click.echo(f"     ... and {len(suggestion.suggested_patterns) - 3} more")
-            click.echo()
+            confidence = suggestion.confidence
+            patterns = suggestion.suggested_patterns
+            lines = [
+                f"{i}. {suggestion.label}",
+                f"   Key: {suggestion.key}",
+                f"   Type: {suggestion.type}",
+                f"   Confidence: [{_CONFIDENCE_BARS[min(10, int(confidence * 10))]}] {confidence:.1%}",
+                f"   Accounts: {suggestion.account_count}",
+                "   Sample accounts:",
+            ]
+            lines.extend(f"     - {sample}" for sample in suggestion.sample_accounts[:3])
+            lines.append("   Suggested patterns:")
+            lines.extend(f"     - {pattern}" for pattern in patterns[:3])
+            if len(patterns) > 3:
+                lines.append(f"     ... and {len(patterns) - 3} more")
+            lines.append("")
+            click.echo("\n".join(lines))
 
         if result.unmapped_accounts:
             click.echo(f"=== Unmapped Accounts ({len(result.unmapped_accounts)}) ===\n")
             click.echo("These accounts don't match suggested patterns and may need manual mapping:\n")
-            for account in result.unmapped_accounts[:10]:
-                click.echo(f"  - {account.full_name}")
+            click.echo("\n".join(
+                f"  - {account.full_name}" for account in result.unmapped_accounts[:10]
+            ))
             if len(result.unmapped_accounts) > 10:
                 click.echo(f"  ... and {len(result.unmapped_accounts) - 10} more")
             click.echo()
@@ -213,7 +231,7 @@ def infer(book_file, entity_map_file, output_file, merge):
                 "patterns": suggested_map.patterns,
             }
 
-            click.echo(json.dumps(map_dict, indent=2))
+            click.echo(json_dumps(map_dict, indent=True).decode("utf-8"))
             click.echo()
             click.echo("To regenerate entity mapping:")
             click.echo(f"  gcgaap entity remap -f {book_file}")
@@ -248,11 +266,8 @@ def remap(ctx, book_file, output_file):
     logger.info("=== GCGAAP Entity Remapping ===")
 
     try:
-        import sys as _sys
-        tools_path = Path(__file__).parent.parent / "tools"
-        _sys.path.insert(0, str(tools_path))
-
-        from entity_account_mapper import (
+        from .._json import dumps as json_dumps
+        from ..tools.entity_account_mapper import (
             build_entity_patterns,
             build_account_tree,
             assign_entities_with_inheritance,
@@ -294,8 +309,8 @@ def remap(ctx, book_file, output_file):
             }
 
             output_path = Path(output_file)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
+            with open(output_path, "wb") as f:
+                f.write(json_dumps(output, indent=True))
 
             click.echo(f"Entity mapping written to: {output_path}")
             click.echo()
@@ -12,25 +12,6 @@ import click
 from ..config import GCGAAPConfig
 from ..entity_map import EntityMap
 from ..gnucash_access import GnuCashBook
-from ..reports.balance_sheet import (
-    generate_balance_sheet,
-    format_as_text,
-    format_as_csv,
-    format_as_json,
-    check_entity_balance,
-)
-from ..reports.income_statement import (
-    generate_income_statement,
-    format_as_text as is_format_text,
-    format_as_csv as is_format_csv,
-    format_as_json as is_format_json,
-)
-from ..reports.trial_balance import (
-    generate_trial_balance,
-    format_as_text as tb_format_text,
-    format_as_csv as tb_format_csv,
-    format_as_json as tb_format_json,
-)
 from ._options import (
     book_file_option,
     entity_map_option,
@@ -40,9 +21,14 @@ from ._options import (
     format_option,
     entity_filter_option,
 )
+from ._output import echo_formatted
 
 logger = logging.getLogger(__name__)
 
+# Column formatters for the balance-check summary rows
+_MONEY = "${:>15,.2f}".format
+_LABEL = "{:40s}".format
+
 
 @click.group(name="report")
 def report_group():
@@ -82,6 +68,13 @@ def balance_sheet(book_file, entity_map_file, as_of, entity, format):
     - The accounting equation doesn't balance
     - Strict validation fails for any reason
     """
+    from ..reports.balance_sheet import (
+        generate_balance_sheet,
+        format_as_text,
+        format_as_csv,
+        format_as_json,
+    )
+
     logger.info("=== GCGAAP Balance Sheet Report ===")
 
     try:
@@ -102,15 +95,11 @@ def balance_sheet(book_file, entity_map_file, as_of, entity, format):
                 config=config,
             )
 
-        if format.lower() == "csv":
-            output = format_as_csv(balance_sheet_obj)
-        elif format.lower() == "json":
-            output = format_as_json(balance_sheet_obj)
-        else:
-            output = format_as_text(balance_sheet_obj)
+        formatters = {"csv": format_as_csv, "json": format_as_json, "text": format_as_text}
+        output = formatters[format.lower()](balance_sheet_obj)
 
         click.echo()
-        click.echo(output)
+        echo_formatted(output, format)
         sys.exit(0)
 
     except ValueError as e:
@@ -135,7 +124,14 @@ def balance_sheet(book_file, entity_map_file, as_of, entity, format):
 @book_file_option
 @entity_map_option()
 @as_of_option(required=True)
-def balance_check(book_file, entity_map_file, as_of):
+@click.option(
+    "--quick",
+    is_flag=True,
+    default=False,
+    help="Stop after the consolidated check if it balances "
+         "(per-entity imbalances are not reported).",
+)
+def balance_check(book_file, entity_map_file, as_of, quick):
     """
     Quick balance check for all entities and consolidated.
 
@@ -147,7 +143,14 @@ def balance_check(book_file, entity_map_file, as_of):
     - Consolidated (all entities) balance status
     - Individual entity balance status
     - Imbalance amounts for entities that don't balance
+
+    With --quick, a balanced consolidated result ends the check. Entity
+    imbalances that offset each other (e.g. cross-entity transactions
+    without balancing equity splits) still balance when consolidated,
+    so --quick cannot detect them.
     """
+    from ..reports.balance_sheet import check_entity_balance, precompute_account_balances
+
     logger.info("=== GCGAAP Balance Check (All Entities) ===")
 
     try:
@@ -161,62 +164,79 @@ def balance_check(book_file, entity_map_file, as_of):
 
             # Consolidated
             click.echo("\nChecking consolidated (all entities)...")
-            results = [check_entity_balance(book, entity_map, as_of, None, config)]
+            # Validate and sum balances once; each entity only filters them
+            try:
+                precomputed = precompute_account_balances(book, entity_map, as_of, config)
+            except ValueError:
+                # e.g. an invalid --as-of date; each entity check reports it
+                precomputed = None
+            results = [
+                check_entity_balance(book, entity_map, as_of, None, config, precomputed)
+            ]
+
+            if quick and results[0].balanced:
+                click.echo("\n[OK] CONSOLIDATED BALANCED - per-entity check skipped (--quick)")
+                sys.exit(0)
 
             # Per entity
-            for entity_key, entity_config in entity_map.entities.items():
-                if entity_key == "unassigned":
-                    continue
-                click.echo(f"Checking {entity_config.label}...")
+            entities_to_check = tuple(
+                (key, entity.label)
+                for key, entity in entity_map.entities.items()
+                if key != "unassigned"
+            )
+            for entity_key, entity_label in entities_to_check:
+                click.echo(f"Checking {entity_label}...")
                 results.append(
-                    check_entity_balance(book, entity_map, as_of, entity_key, config)
+                    check_entity_balance(
+                        book, entity_map, as_of, entity_key, config, precomputed
+                    )
                 )
 
-        # Display summary
-        click.echo("\n" + "=" * 80)
-        click.echo("SUMMARY")
-        click.echo("=" * 80)
-
+        # Display summary, written in one piece once it is assembled
         balanced_count = sum(1 for r in results if r.balanced)
         imbalanced_count = len(results) - balanced_count
 
+        lines = ["\n" + "=" * 80, "SUMMARY", "=" * 80]
+
         if balanced_count > 0:
-            click.echo(f"\n[OK] BALANCED ({balanced_count}):")
-            click.echo("-" * 80)
+            lines.append(f"\n[OK] BALANCED ({balanced_count}):")
+            lines.append("-" * 80)
+            lines.extend(
+                f"  [OK] {_LABEL(result.entity_label)} "
+                f"A: {_MONEY(result.total_assets)}  "
+                f"L: {_MONEY(result.total_liabilities)}  "
+                f"E: {_MONEY(result.total_equity)}"
+                for result in results
+                if result.balanced
+            )
+
+        if imbalanced_count > 0:
+            lines.append(f"\n[X] IMBALANCED ({imbalanced_count}):")
+            lines.append("-" * 80)
             for result in results:
                 if result.balanced:
-                    click.echo(
-                        f"  [OK] {result.entity_label:40s} "
-                        f"A: ${result.total_assets:>15,.2f}  "
-                        f"L: ${result.total_liabilities:>15,.2f}  "
-                        f"E: ${result.total_equity:>15,.2f}"
+                    continue
+                if result.error:
+                    lines.append(f"  [X] {_LABEL(result.entity_label)} ERROR: {result.error}")
+                else:
+                    lines.append(
+                        f"  [X] {_LABEL(result.entity_label)} "
+                        f"A: {_MONEY(result.total_assets)}  "
+                        f"L: {_MONEY(result.total_liabilities)}  "
+                        f"E: {_MONEY(result.total_equity)}  "
+                        f"Imbalance: {_MONEY(result.imbalance)}"
                     )
 
-        if imbalanced_count > 0:
-            click.echo(f"\n[X] IMBALANCED ({imbalanced_count}):")
-            click.echo("-" * 80)
-            for result in results:
-                if not result.balanced:
-                    if result.error:
-                        click.echo(f"  [X] {result.entity_label:40s} ERROR: {result.error}")
-                    else:
-                        click.echo(
-                            f"  [X] {result.entity_label:40s} "
-                            f"A: ${result.total_assets:>15,.2f}  "
-                            f"L: ${result.total_liabilities:>15,.2f}  "
-                            f"E: ${result.total_equity:>15,.2f}  "
-                            f"Imbalance: ${result.imbalance:>15,.2f}"
-                        )
-
-        click.echo("\n" + "=" * 80)
+        lines.append("\n" + "=" * 80)
 
         if imbalanced_count == 0:
-            click.echo("[OK] ALL ENTITIES BALANCED - Books are in good order!")
-            sys.exit(0)
+            lines.append("[OK] ALL ENTITIES BALANCED - Books are in good order!")
         else:
-            click.echo(f"[X] {imbalanced_count} entity/entities have accounting equation violations")
-            click.echo("  Review and fix imbalanced entities before generating reports.")
-            sys.exit(1)
+            lines.append(f"[X] {imbalanced_count} entity/entities have accounting equation violations")
+            lines.append("  Review and fix imbalanced entities before generating reports.")
+
+        click.echo("\n".join(lines))
+        sys.exit(0 if imbalanced_count == 0 else 1)
 
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}")
@@ -247,6 +267,13 @@ def income_statement(book_file, entity_map_file, from_date, to_date, entity, for
 
     Use --entity to generate a report for one entity, or omit for consolidated.
     """
+    from ..reports.income_statement import (
+        generate_income_statement,
+        format_as_text as is_format_text,
+        format_as_csv as is_format_csv,
+        format_as_json as is_format_json,
+    )
+
     logger.info("=== GCGAAP Income Statement Report ===")
 
     try:
@@ -268,15 +295,11 @@ def income_statement(book_file, entity_map_file, from_date, to_date, entity, for
                 config=config,
             )
 
-        if format.lower() == "csv":
-            output = is_format_csv(report)
-        elif format.lower() == "json":
-            output = is_format_json(report)
-        else:
-            output = is_format_text(report)
+        formatters = {"csv": is_format_csv, "json": is_format_json, "text": is_format_text}
+        output = formatters[format.lower()](report)
 
         click.echo()
-        click.echo(output)
+        echo_formatted(output, format)
         sys.exit(0)
 
     except ValueError as e:
@@ -313,6 +336,13 @@ def trial_balance(book_file, entity_map_file, as_of, entity, format):
 
     Use --entity to generate a report for one entity, or omit for consolidated.
     """
+    from ..reports.trial_balance import (
+        generate_trial_balance,
+        format_as_text as tb_format_text,
+        format_as_csv as tb_format_csv,
+        format_as_json as tb_format_json,
+    )
+
     logger.info("=== GCGAAP Trial Balance Report ===")
 
     try:
@@ -333,15 +363,11 @@ def trial_balance(book_file, entity_map_file, as_of, entity, format):
                 config=config,
             )
 
-        if format.lower() == "csv":
-            output = tb_format_csv(report)
-        elif format.lower() == "json":
-            output = tb_format_json(report)
-        else:
-            output = tb_format_text(report)
+        formatters = {"csv": tb_format_csv, "json": tb_format_json, "text": tb_format_text}
+        output = formatters[format.lower()](report)
 
         click.echo()
-        click.echo(output)
+        echo_formatted(output, format)
         sys.exit(0 if report.is_balanced() else 1)
 
     except ValueError as e:
@@ -11,8 +11,6 @@ import click
 
 from ..entity_map import EntityMap
 from ..gnucash_access import GnuCashBook, parse_date
-from ..cross_entity import analyze_cross_entity_transactions
-from ..balance_xacts import run_balance_xacts_workflow
 from ._options import book_file_option, entity_map_option, as_of_option
 
 logger = logging.getLogger(__name__)
@@ -90,6 +88,8 @@ def cross_entity(book_file, entity_map_file, as_of, entity, verbose, limit, simp
     # Show simple one-line format
     gcgaap xact cross-entity -f book.gnucash --simple
     """
+    from ..cross_entity import analyze_cross_entity_transactions
+
     logger.info("=== GCGAAP Cross-Entity Transaction Analysis ===")
 
     try:
@@ -195,7 +195,7 @@ def balance(book_file, entity_map_file, entity, date_from, date_to, dry_run):
     2. Groups transactions by entity pair and expense account (max 9 per group)
     3. Presents each group for user approval
     4. Adds balancing splits with cross-referenced memos
-    5. Saves changes after each approved group
+    5. Saves the approved changes once every group has been reviewed
 
     \b
     Requirements:
@@ -206,6 +206,8 @@ def balance(book_file, entity_map_file, entity, date_from, date_to, dry_run):
     \b
     A backup is automatically created before any changes are made.
     """
+    from ..balance_xacts import run_balance_xacts_workflow
+
     logger.info("=== GCGAAP Balance Cross-Entity Transactions ===")
 
     try:
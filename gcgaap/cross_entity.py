@@ -45,6 +45,7 @@ class CrossEntityTransaction:
         description: Transaction description.
         post_date: Transaction date.
         splits_info: Detailed information about each split.
+        expense_account_name: Full name of the first Expenses: split's account, if any.
     """
     
     transaction: GCTransaction
@@ -53,6 +54,7 @@ class CrossEntityTransaction:
     description: str
     post_date: date
     splits_info: list[SplitInfo] = field(default_factory=list)
+    expense_account_name: Optional[str] = None
     
     def is_balanced_per_entity(self, tolerance: float = 0.01) -> bool:
         """Check if all entity amounts sum to zero."""
@@ -488,7 +490,8 @@ class CrossEntityAnalysis:
 def analyze_cross_entity_transactions(
     book: GnuCashBook,
     entity_map: EntityMap,
-    as_of_date: Optional[date] = None
+    as_of_date: Optional[date] = None,
+    split_count: Optional[int] = None
 ) -> CrossEntityAnalysis:
     """
     Analyze transactions that span multiple entities.
@@ -497,6 +500,8 @@ def analyze_cross_entity_transactions(
         book: GnuCash book to analyze.
         entity_map: Entity mapping configuration.
         as_of_date: Optional date to analyze as of (default: all transactions).
+        split_count: Optional exact split count; other transactions are
+                     skipped in SQL (the totals then cover only these).
         
     Returns:
         CrossEntityAnalysis object with detailed findings.
@@ -515,12 +520,11 @@ def analyze_cross_entity_transactions(
     inter_entity_flows: dict[tuple[str, str], list[Decimal]] = defaultdict(list)
     
     # Analyze each transaction
-    for txn in book.iter_transactions():
-        # Filter by date if specified
-        if as_of_date:
-            txn_date = parse_date(txn.post_date)
-            if txn_date and txn_date > as_of_date:
-                continue
+    for txn in book.iter_transactions(split_count=split_count):
+        # Filter by date if specified (the parsed date is reused below)
+        txn_date = parse_date(txn.post_date) if as_of_date else None
+        if txn_date and txn_date > as_of_date:
+            continue
         
         # Determine which entities are involved
         entity_amounts: dict[str, Decimal] = defaultdict(Decimal)
@@ -556,8 +560,13 @@ def analyze_cross_entity_transactions(
                 entities_involved=entities_in_txn,
                 entity_amounts=entity_amounts,
                 description=txn.description,
-                post_date=parse_date(txn.post_date) or date.today(),
-                splits_info=splits_info_list
+                post_date=txn_date or parse_date(txn.post_date) or date.today(),
+                splits_info=splits_info_list,
+                expense_account_name=next(
+                    (info.account_name for info in splits_info_list
+                     if info.account_name.startswith('Expenses:')),
+                    None
+                )
             )
             
             analysis.cross_entity_transactions.append(cross_txn)
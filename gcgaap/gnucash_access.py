@@ -113,7 +113,7 @@ class GCTransaction:
 
 class GnuCashBook:
     """
-    Context-managed abstraction for read-only access to a GnuCash book.
+    Context-managed abstraction for access to a GnuCash book.
     
     This class wraps the underlying piecash library and provides a stable
     interface for iterating over accounts and transactions.
@@ -124,14 +124,17 @@ class GnuCashBook:
                 print(account.full_name)
     """
     
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, readonly: bool = True):
         """
         Initialize the GnuCash book accessor.
         
         Args:
             path: Path to the GnuCash book file (.gnucash or .db).
+            readonly: If False, open the book writable so callers can
+                      modify it through piecash_book.
         """
         self.path = path
+        self.readonly = readonly
         self._book = None
         self._session = None
         
@@ -139,7 +142,7 @@ class GnuCashBook:
     
     def __enter__(self) -> "GnuCashBook":
         """
-        Open the GnuCash book for reading.
+        Open the GnuCash book (read-only unless readonly=False was given).
         
         Returns:
             Self for use in with statement.
@@ -156,10 +159,10 @@ class GnuCashBook:
             
             logger.debug(f"Opening GnuCash book: {self.path}")
             
-            # Open in read-only mode with do_backup=False to prevent modifications
+            # do_backup=False: writers make their own backup first
             self._book = piecash.open_book(
                 str(self.path),
-                readonly=True,
+                readonly=self.readonly,
                 do_backup=False
             )
             
@@ -192,6 +195,19 @@ class GnuCashBook:
             finally:
                 self._book = None
     
+    @property
+    def piecash_book(self):
+        """
+        The underlying piecash Book, for callers that need to modify it.
+        
+        Raises:
+            RuntimeError: If called outside of context manager.
+        """
+        if self._book is None:
+            raise RuntimeError("Book not opened. Use within 'with' statement.")
+        
+        return self._book
+    
     def iter_accounts(self) -> Iterable[GCAccount]:
         """
         Iterate over all accounts in the book.
@@ -228,10 +244,15 @@ class GnuCashBook:
                 is_placeholder=is_placeholder
             )
     
-    def iter_transactions(self) -> Iterable[GCTransaction]:
+    def iter_transactions(self, split_count: Optional[int] = None) -> Iterable[GCTransaction]:
         """
         Iterate over all transactions in the book.
         
+        Args:
+            split_count: If given, only transactions with exactly this many
+                         splits are read. The count is checked in SQL, so
+                         other transactions are never loaded.
+        
         Yields:
             GCTransaction instances for each transaction in the book.
             Skips transactions with data integrity issues (logged as errors).
@@ -248,7 +269,16 @@ class GnuCashBook:
         transaction_count = 0
         error_transactions = []  # Collect all error details
         
-        for transaction in self._book.transactions:
+        transactions = self._preload_splits(split_count)
+        if not transactions:
+            # Batched loading failed (or found nothing): read lazily, so a
+            # bad split only affects the transaction it belongs to
+            if split_count is None:
+                transactions = self._book.transactions
+            else:
+                transactions = self._query_transactions(split_count)
+        
+        for transaction in transactions:
             try:
                 # Try to access basic transaction properties first
                 trans_guid = str(transaction.guid)
@@ -257,10 +287,10 @@ class GnuCashBook:
                 # Try to get account names from splits BEFORE trying to parse date
                 # (the error might happen when accessing splits due to datetime issues)
                 account_info = []
-                split_count = 0
+                valid_splits = 0
                 try:
                     for split in transaction.splits:
-                        split_count += 1
+                        valid_splits += 1
                         try:
                             account_name = split.account.name if split.account else "Unknown"
                             account_info.append(account_name)
@@ -274,7 +304,7 @@ class GnuCashBook:
                         f"GUID: {trans_guid}\n"
                         f"    Description: {trans_desc}\n"
                         f"    Accounts: {accounts_str}\n"
-                        f"    Split Count: {split_count}\n"
+                        f"    Split Count: {valid_splits}\n"
                         f"    Error: {str(split_error)}"
                     )
                     
@@ -353,6 +383,59 @@ class GnuCashBook:
         
         logger.debug(f"Successfully iterated {transaction_count} transactions")
     
+    def _query_transactions(self, split_count: Optional[int] = None):
+        """
+        Build a query for the book's transactions.
+        
+        Args:
+            split_count: If given, only transactions with exactly this many
+                         splits are selected (counted in SQL).
+        
+        Returns:
+            SQLAlchemy query over piecash Transaction objects.
+        """
+        import piecash
+        from sqlalchemy import func
+        
+        session = self._book.session
+        query = session.query(piecash.Transaction)
+        if split_count is not None:
+            matching_guids = (
+                session.query(piecash.Split.transaction_guid)
+                .group_by(piecash.Split.transaction_guid)
+                .having(func.count(piecash.Split.guid) == split_count)
+            )
+            query = query.filter(piecash.Transaction.guid.in_(matching_guids))
+        return query
+    
+    def _preload_splits(self, split_count: Optional[int] = None) -> list:
+        """
+        Load transactions together with their splits in batched queries.
+        
+        Reading the splits of the returned transactions needs no further
+        queries, instead of one lazy query per transaction.
+        
+        Args:
+            split_count: Same filter as iter_transactions().
+        
+        Returns:
+            The loaded transactions, or an empty list if a split row
+            could not be read.
+        """
+        import piecash
+        from sqlalchemy.orm import selectinload
+        
+        query = self._query_transactions(split_count).options(
+            selectinload(piecash.Transaction.splits)
+        )
+        try:
+            return query.all()
+        except Exception as e:
+            # One unreadable split row fails its whole batch; the lazy path
+            # in iter_transactions reports each bad transaction on its own
+            logger.debug(f"Batched split loading failed, loading per transaction: {e}")
+            return []
+    
     def get_account_by_guid(self, guid: str) -> Optional[GCAccount]:
         """
         Retrieve a specific account by its GUID.
@@ -543,6 +626,14 @@ def parse_date(date_str: str) -> date:
     Raises:
         ValueError: If date_str is not in correct format.
     """
+    # Fast path for the canonical form; strptime is several times slower and
+    # this runs once per transaction during cross-entity analysis
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass  # Let strptime produce the error below
+    
     try:
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError as e:
@@ -61,15 +61,23 @@ def create_backup(db_path: Path) -> Path:
         raise IOError(f"Could not create backup: {e}")
 
 
-def diagnose_empty_reconcile_dates(db_path: Path) -> Tuple[int, List[str]]:
+def diagnose_empty_reconcile_dates(
+    db_path: Path,
+    sample_size: int = 10
+) -> Tuple[int, int, List[str]]:
     """
     Diagnose how many splits have empty reconcile_date fields.
     
+    Only a sample of the affected transaction descriptions is fetched;
+    the totals come from COUNT queries.
+    
     Args:
         db_path: Path to the GnuCash database file.
+        sample_size: Maximum number of descriptions to return (default: 10).
         
     Returns:
-        Tuple of (count of affected splits, list of affected transaction descriptions).
+        Tuple of (count of affected splits, count of distinct affected
+        transaction descriptions, first sample_size of those descriptions).
         
     Raises:
         sqlite3.Error: If database access fails.
@@ -90,20 +98,35 @@ def diagnose_empty_reconcile_dates(db_path: Path) -> Tuple[int, List[str]]:
         
         count = cursor.fetchone()['count']
         
-        # Get descriptions of affected transactions
+        # Count descriptions of affected transactions (a NULL description
+        # counts once, as it does in the sample below)
+        cursor.execute("""
+            SELECT COUNT(*) as count
+            FROM (
+                SELECT DISTINCT t.description
+                FROM transactions t
+                JOIN splits s ON t.guid = s.tx_guid
+                WHERE s.reconcile_date = ''
+            )
+        """)
+        
+        description_count = cursor.fetchone()['count']
+        
+        # Fetch only the descriptions that will be shown
         cursor.execute("""
             SELECT DISTINCT t.description
             FROM transactions t
             JOIN splits s ON t.guid = s.tx_guid
             WHERE s.reconcile_date = ''
             ORDER BY t.description
-        """)
+            LIMIT ?
+        """, (sample_size,))
         
         descriptions = [row['description'] for row in cursor.fetchall()]
         
-        logger.info(f"Found {count} splits with empty reconcile_date in {len(descriptions)} transactions")
+        logger.info(f"Found {count} splits with empty reconcile_date in {description_count} transactions")
         
-        return count, descriptions
+        return count, description_count, descriptions
         
     finally:
         conn.close()
@@ -45,6 +45,35 @@ EXPENSE_TYPES = {
 }
 
 
+class ImbalanceError(ValueError):
+    """
+    Raised when a Balance Sheet fails the accounting equation.
+    
+    Carries the totals so callers can report them without parsing
+    the message.
+    
+    Attributes:
+        assets: Total assets.
+        liabilities: Total liabilities.
+        equity: Total equity (including retained earnings).
+        imbalance: Imbalance amount (A - L - E).
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        assets: float,
+        liabilities: float,
+        equity: float,
+        imbalance: float
+    ):
+        super().__init__(message)
+        self.assets = assets
+        self.liabilities = liabilities
+        self.equity = equity
+        self.imbalance = imbalance
+
+
 def classify_account_type(account: GCAccount) -> str:
     """
     Classify a GnuCash account into Balance Sheet or Income Statement category.
@@ -157,12 +186,74 @@ class BalanceSheet:
         return is_balanced, delta
 
 
+@dataclass
+class AccountBalances:
+    """
+    Validated account data shared by balance sheets for one date.
+    
+    Built once by precompute_account_balances() so several entity
+    balance sheets can be projected from a single book pass.
+    
+    Attributes:
+        as_of_date: Date the balances were calculated for.
+        accounts: All accounts keyed by GUID.
+        balances: Account balances keyed by GUID.
+    """
+    
+    as_of_date: date
+    accounts: dict[str, GCAccount]
+    balances: dict[str, float]
+
+
+def precompute_account_balances(
+    book: GnuCashBook,
+    entity_map: EntityMap,
+    as_of_date_str: str,
+    config: Optional[GCGAAPConfig] = None
+) -> AccountBalances:
+    """
+    Validate the book and calculate every account balance once.
+    
+    Runs the same strict validation as generate_balance_sheet, so the
+    result can be passed to it for any number of entities.
+    
+    Args:
+        book: Opened GnuCashBook.
+        entity_map: EntityMap for account resolution.
+        as_of_date_str: Date string in YYYY-MM-DD format.
+        config: Optional configuration; uses default if not provided.
+        
+    Returns:
+        AccountBalances for the as-of date.
+        
+    Raises:
+        RuntimeError: If strict validation fails (unmapped accounts exist).
+    """
+    if config is None:
+        from ..config import default_config
+        config = default_config
+    
+    as_of_date = parse_date(as_of_date_str)
+    
+    logger.info("Running strict validation (required for GAAP compliance)")
+    validate_for_reporting(book, entity_map, config)
+    logger.info("[OK] Strict validation passed")
+    
+    logger.info(f"Calculating account balances as of {as_of_date}")
+    accounts = {acc.guid: acc for acc in book.iter_accounts()}
+    balances = book.get_account_balances(as_of_date)
+    logger.info(f"Calculated balances for {len(balances)} accounts")
+    
+    return AccountBalances(as_of_date=as_of_date, accounts=accounts, balances=balances)
+
+
 def generate_balance_sheet(
     book: GnuCashBook,
     entity_map: EntityMap,
     as_of_date_str: str,
     entity_key: Optional[str] = None,
-    config: Optional[GCGAAPConfig] = None
+    config: Optional[GCGAAPConfig] = None,
+    precomputed: Optional[AccountBalances] = None
 ) -> BalanceSheet:
     """
     Generate a GAAP-compliant Balance Sheet.
@@ -179,13 +270,16 @@ def generate_balance_sheet(
         entity_key: Optional entity key for entity-specific report.
                    If None, generates consolidated report.
         config: Optional configuration; uses default if not provided.
+        precomputed: Optional result of precompute_account_balances() for
+                    the same date; skips re-running validation and the
+                    balance calculation.
         
     Returns:
         BalanceSheet instance.
         
     Raises:
         RuntimeError: If strict validation fails (unmapped accounts exist).
-        ValueError: If accounting equation doesn't balance.
+        ImbalanceError: If accounting equation doesn't balance.
     """
     if config is None:
         from ..config import default_config
@@ -200,16 +294,21 @@ def generate_balance_sheet(
     else:
         logger.info("Type: Consolidated (all entities)")
     
-    # STEP 1: MANDATORY strict validation
-    logger.info("Step 1: Running strict validation (required for GAAP compliance)")
-    validate_for_reporting(book, entity_map, config)
-    logger.info("[OK] Strict validation passed")
-    
-    # STEP 2: Get all accounts and balances
-    logger.info("Step 2: Calculating account balances")
-    all_accounts = {acc.guid: acc for acc in book.iter_accounts()}
-    balances = book.get_account_balances(as_of_date)
-    logger.info(f"Calculated balances for {len(balances)} accounts")
+    if precomputed is not None:
+        # STEPS 1-2 already done by precompute_account_balances()
+        all_accounts = precomputed.accounts
+        balances = precomputed.balances
+    else:
+        # STEP 1: MANDATORY strict validation
+        logger.info("Step 1: Running strict validation (required for GAAP compliance)")
+        validate_for_reporting(book, entity_map, config)
+        logger.info("[OK] Strict validation passed")
+        
+        # STEP 2: Get all accounts and balances
+        logger.info("Step 2: Calculating account balances")
+        all_accounts = {acc.guid: acc for acc in book.iter_accounts()}
+        balances = book.get_account_balances(as_of_date)
+        logger.info(f"Calculated balances for {len(balances)} accounts")
     
     # STEP 3: Filter accounts by entity (if specified)
     filtered_accounts = {}
@@ -320,7 +419,13 @@ def generate_balance_sheet(
             f"This indicates a serious data integrity issue."
         )
         logger.error(error_msg)
-        raise ValueError(error_msg)
+        raise ImbalanceError(
+            error_msg,
+            assets=balance_sheet.total_assets,
+            liabilities=balance_sheet.total_liabilities,
+            equity=balance_sheet.total_equity,
+            imbalance=delta,
+        )
     
     logger.info("[OK] Accounting equation verified (within tolerance)")
     logger.info(f"Total Assets: {balance_sheet.total_assets:,.2f}")
@@ -526,12 +631,13 @@ def check_entity_balance(
     as_of_date_str: str,
     entity_key: Optional[str],
     config: GCGAAPConfig,
+    precomputed: Optional[AccountBalances] = None,
 ) -> BalanceCheckResult:
     """
     Run a balance sheet for one entity and return a structured result.
 
-    Calls generate_balance_sheet and catches ValueError so callers don't
-    have to parse the error message string.
+    Calls generate_balance_sheet and catches ImbalanceError (and any other
+    ValueError) so callers don't have to inspect the exception.
 
     Args:
         book: Open GnuCashBook context.
@@ -539,6 +645,7 @@ def check_entity_balance(
         as_of_date_str: Date string in YYYY-MM-DD format.
         entity_key: Entity key, or None for consolidated.
         config: GCGAAPConfig instance.
+        precomputed: Optional AccountBalances shared across entities.
 
     Returns:
         BalanceCheckResult with balance data or error information.
@@ -555,6 +662,7 @@ def check_entity_balance(
             as_of_date_str=as_of_date_str,
             entity_key=entity_key,
             config=config,
+            precomputed=precomputed,
         )
         return BalanceCheckResult(
             entity_key=entity_key,
@@ -565,31 +673,20 @@ def check_entity_balance(
             total_equity=bs.total_equity,
             imbalance=0.0,
         )
+    except ImbalanceError as e:
+        return BalanceCheckResult(
+            entity_key=entity_key,
+            entity_label=label,
+            balanced=False,
+            total_assets=e.assets,
+            total_liabilities=e.liabilities,
+            total_equity=e.equity,
+            imbalance=e.imbalance,
+        )
     except ValueError as e:
-        error_str = str(e)
-        if "Imbalance (A - L - E):" in error_str:
-            assets = liabilities = equity = imbalance = 0.0
-            for line in error_str.split("\n"):
-                if line.startswith("Assets:"):
-                    assets = float(line.split(":")[1].strip().replace(",", ""))
-                elif line.startswith("Liabilities:"):
-                    liabilities = float(line.split(":")[1].strip().replace(",", ""))
-                elif line.startswith("Equity:"):
-                    equity = float(line.split(":")[1].strip().replace(",", ""))
-                elif line.startswith("Imbalance"):
-                    imbalance = float(line.split(":")[1].strip().replace(",", ""))
-            return BalanceCheckResult(
-                entity_key=entity_key,
-                entity_label=label,
-                balanced=False,
-                total_assets=assets,
-                total_liabilities=liabilities,
-                total_equity=equity,
-                imbalance=imbalance,
-            )
         return BalanceCheckResult(
             entity_key=entity_key,
             entity_label=label,
             balanced=False,
-            error=error_str,
+            error=str(e),
         )
@@ -4,19 +4,25 @@ Database snapshot and comparison utilities.
 Provides tools for capturing GnuCash database state and comparing
 snapshots to identify what changed during fixes or external utility operations.
 """
-import json
+import functools
+import hashlib
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from ._json import dumps as json_dumps
+from ._json import loads as json_loads
 from .gnucash_access import GnuCashBook
 
 logger = logging.getLogger(__name__)
 
+# Start of every saved snapshot, up to the timestamp value
+_TIMESTAMP_HEADER = b'{\n  "timestamp": '
 
-@dataclass
+
+@dataclass(slots=True)
 class TransactionSnapshot:
     """Snapshot of a single transaction's state."""
     
@@ -30,10 +36,19 @@ class TransactionSnapshot:
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every leaf, and splits are already plain dicts
+        return {
+            "guid": self.guid,
+            "description": self.description,
+            "post_date": self.post_date,
+            "enter_date": self.enter_date,
+            "split_count": self.split_count,
+            "splits": self.splits,
+            "error": self.error,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountSnapshot:
     """Snapshot of a single account's state."""
     
@@ -46,7 +61,53 @@ class AccountSnapshot:
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "guid": self.guid,
+            "full_name": self.full_name,
+            "type": self.type,
+            "commodity_symbol": self.commodity_symbol,
+            "parent_guid": self.parent_guid,
+            "balance": self.balance,
+        }
+
+
+def _format_timestamp(value) -> str:
+    """
+    Format a piecash date or datetime as "YYYY-MM-DD HH:MM:SS".
+    
+    Produces the same text as strftime("%Y-%m-%d %H:%M:%S") so snapshots
+    stay comparable with older ones, but uses isoformat, which is much
+    cheaper. piecash returns post_date as a plain date (midnight) and
+    enter_date as a timezone-aware datetime, whose UTC offset is dropped.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ', timespec='seconds')[:19]
+    return f"{value.isoformat()} 00:00:00"
+
+
+def _write_records(f, records: dict) -> None:
+    """
+    Write a guid -> snapshot mapping as an indented JSON object.
+    
+    Produces the same layout as encoding the whole mapping at once,
+    one record at a time.
+    
+    Args:
+        f: Binary file to write to.
+        records: Mapping of guid to AccountSnapshot or TransactionSnapshot.
+    """
+    if not records:
+        f.write(b"{}")
+        return
+    
+    separator = b"{\n    "
+    for guid, record in records.items():
+        f.write(separator)
+        f.write(json_dumps(guid))
+        f.write(b": ")
+        f.write(json_dumps(record.to_dict(), indent=True).replace(b"\n", b"\n    "))
+        separator = b",\n    "
+    f.write(b"\n  }")
 
 
 class DatabaseSnapshot:
@@ -102,7 +163,7 @@ class DatabaseSnapshot:
             for transaction in book._book.transactions:
                 try:
                     # Try to read transaction data safely
-                    trans_guid = str(transaction.guid)
+                    trans_guid = transaction.guid
                     trans_desc = transaction.description if transaction.description else ""
                     
                     # Try to get dates
@@ -111,12 +172,14 @@ class DatabaseSnapshot:
                     error = None
                     
                     try:
-                        post_date = transaction.post_date.strftime("%Y-%m-%d %H:%M:%S") if transaction.post_date else None
+                        post_value = transaction.post_date
+                        post_date = _format_timestamp(post_value) if post_value else None
                     except Exception as e:
                         error = f"post_date: {str(e)}"
                     
                     try:
-                        enter_date = transaction.enter_date.strftime("%Y-%m-%d %H:%M:%S") if hasattr(transaction, 'enter_date') and transaction.enter_date else None
+                        enter_value = getattr(transaction, 'enter_date', None)
+                        enter_date = _format_timestamp(enter_value) if enter_value else None
                     except Exception as e:
                         if error:
                             error += f"; enter_date: {str(e)}"
@@ -130,9 +193,10 @@ class DatabaseSnapshot:
                         for split in transaction.splits:
                             split_count += 1
                             try:
+                                account = split.account
                                 splits.append({
-                                    "account_guid": str(split.account.guid) if split.account else None,
-                                    "account_name": split.account.name if split.account else None,
+                                    "account_guid": account.guid if account else None,
+                                    "account_name": account.name if account else None,
                                     "value": float(split.value) if split.value is not None else None,
                                     "quantity": float(split.quantity) if split.quantity is not None else None,
                                     "memo": split.memo if split.memo else None,
@@ -180,15 +244,18 @@ class DatabaseSnapshot:
         Args:
             filepath: Path to save the snapshot to.
         """
-        data = {
-            "timestamp": self.timestamp,
-            "metadata": self.metadata,
-            "accounts": {guid: acc.to_dict() for guid, acc in self.accounts.items()},
-            "transactions": {guid: trans.to_dict() for guid, trans in self.transactions.items()}
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Records are encoded and written one at a time, so peak memory
+        # stays at one record's JSON rather than the whole document
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(_TIMESTAMP_HEADER)
+            f.write(json_dumps(self.timestamp))
+            f.write(b',\n  "metadata": ')
+            f.write(json_dumps(self.metadata, indent=True).replace(b"\n", b"\n  "))
+            f.write(b',\n  "accounts": ')
+            _write_records(f, self.accounts)
+            f.write(b',\n  "transactions": ')
+            _write_records(f, self.transactions)
+            f.write(b"\n}")
         
         logger.info(f"Snapshot saved to {filepath}")
     
@@ -203,8 +270,7 @@ class DatabaseSnapshot:
         Returns:
             DatabaseSnapshot loaded from file.
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_loads(Path(filepath).read_bytes())
         
         snapshot = cls()
         snapshot.timestamp = data["timestamp"]
@@ -222,6 +288,73 @@ class DatabaseSnapshot:
         return snapshot
 
 
+def _read_timestamp(f) -> Optional[str]:
+    """
+    Read the timestamp line at the start of an open snapshot file.
+    
+    Leaves the file positioned after the timestamp line, or at the
+    start if the file does not begin with one.
+    
+    Args:
+        f: Binary snapshot file opened for reading.
+        
+    Returns:
+        The snapshot timestamp, or None if there is no timestamp line.
+    """
+    header = f.readline() + f.readline()
+    if header.startswith(_TIMESTAMP_HEADER) and header.endswith(b",\n"):
+        return json_loads(header[len(_TIMESTAMP_HEADER):-2])
+    f.seek(0)
+    return None
+
+
+def read_snapshot_timestamp(filepath: Path) -> Optional[str]:
+    """
+    Read a snapshot's timestamp without parsing the rest of the file.
+    
+    Args:
+        filepath: Path to the snapshot file.
+        
+    Returns:
+        The snapshot timestamp, or None if the file does not start with one.
+    """
+    with open(filepath, 'rb') as f:
+        return _read_timestamp(f)
+
+
+def snapshot_payloads_identical(first: Path, second: Path) -> bool:
+    """
+    Check whether two snapshot files record the same book state.
+    
+    Every snapshot has its own capture timestamp, so that line is left
+    out of the comparison. Sizes are compared first and the rest of the
+    files is only hashed when they match.
+    
+    Args:
+        first: Path to the first snapshot file.
+        second: Path to the second snapshot file.
+        
+    Returns:
+        True if both files contain the same bytes apart from the timestamp.
+    """
+    with open(first, 'rb') as f1, open(second, 'rb') as f2:
+        _read_timestamp(f1)
+        _read_timestamp(f2)
+        first_size = Path(first).stat().st_size - f1.tell()
+        second_size = Path(second).stat().st_size - f2.tell()
+        if first_size != second_size:
+            return False
+        
+        digests = []
+        for f in (f1, f2):
+            digest = hashlib.blake2b(digest_size=16)
+            for chunk in iter(functools.partial(f.read, 1 << 20), b''):
+                digest.update(chunk)
+            digests.append(digest.digest())
+    
+    return digests[0] == digests[1]
+
+
 def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict:
     """
     Compare two database snapshots and identify changes.
@@ -254,12 +387,7 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
     }
     
     # Compare accounts
-    before_guids = set(before.accounts.keys())
-    after_guids = set(after.accounts.keys())
-    
-    added_guids = after_guids - before_guids
-    removed_guids = before_guids - after_guids
-    common_guids = before_guids & after_guids
+    added_guids, removed_guids, common_guids = _partition_guids(before.accounts, after.accounts)
     
     for guid in added_guids:
         changes["accounts"]["added"].append(after.accounts[guid].to_dict())
@@ -271,7 +399,9 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
         before_acc = before.accounts[guid]
         after_acc = after.accounts[guid]
         
-        if before_acc.to_dict() != after_acc.to_dict():
+        # Dataclass equality compares the same fields to_dict() emits, so
+        # unchanged accounts are skipped without building any dicts
+        if before_acc != after_acc:
             changes["accounts"]["modified"].append({
                 "guid": guid,
                 "before": before_acc.to_dict(),
@@ -279,12 +409,7 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
             })
     
     # Compare transactions
-    before_trans_guids = set(before.transactions.keys())
-    after_trans_guids = set(after.transactions.keys())
-    
-    added_trans = after_trans_guids - before_trans_guids
-    removed_trans = before_trans_guids - after_trans_guids
-    common_trans = before_trans_guids & after_trans_guids
+    added_trans, removed_trans, common_trans = _partition_guids(before.transactions, after.transactions)
     
     for guid in added_trans:
         changes["transactions"]["added"].append(after.transactions[guid].to_dict())
@@ -296,6 +421,13 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
         before_trans = before.transactions[guid]
         after_trans = after.transactions[guid]
         
+        # Unchanged transactions can't be fixed, broken, or modified
+        if before_trans == after_trans:
+            continue
+        
+        before_dict = before_trans.to_dict()
+        after_dict = after_trans.to_dict()
+        
         # Check if transaction was fixed or broken
         before_had_error = before_trans.error is not None
         after_has_error = after_trans.error is not None
@@ -305,8 +437,8 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
             changes["transactions"]["fixed"].append({
                 "guid": guid,
                 "description": after_trans.description,
-                "before": before_trans.to_dict(),
-                "after": after_trans.to_dict(),
+                "before": before_dict,
+                "after": after_dict,
                 "fix_summary": _summarize_fix(before_trans, after_trans)
             })
         elif not before_had_error and after_has_error:
@@ -314,16 +446,16 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
             changes["transactions"]["broken"].append({
                 "guid": guid,
                 "description": after_trans.description,
-                "before": before_trans.to_dict(),
-                "after": after_trans.to_dict()
+                "before": before_dict,
+                "after": after_dict
             })
-        elif before_trans.to_dict() != after_trans.to_dict():
+        else:
             # Transaction was modified
             changes["transactions"]["modified"].append({
                 "guid": guid,
                 "description": after_trans.description,
-                "before": before_trans.to_dict(),
-                "after": after_trans.to_dict()
+                "before": before_dict,
+                "after": after_dict
             })
     
     # Generate summary
@@ -343,6 +475,28 @@ def compare_snapshots(before: DatabaseSnapshot, after: DatabaseSnapshot) -> dict
     return changes
 
 
+def _partition_guids(before: dict, after: dict) -> tuple[list, list, list]:
+    """
+    Split the GUID keys of two snapshot dicts into added, removed and common.
+    
+    Each dict is walked once and every key is classified with a single
+    membership test against the other dict, so no intermediate key sets
+    are built. Results keep the dicts' insertion order.
+    
+    Returns:
+        Tuple of (added, removed, common) GUID lists.
+    """
+    removed = []
+    common = []
+    for guid in before:
+        if guid in after:
+            common.append(guid)
+        else:
+            removed.append(guid)
+    added = [guid for guid in after if guid not in before]
+    return added, removed, common
+
+
 def _summarize_fix(before: TransactionSnapshot, after: TransactionSnapshot) -> dict:
     """
     Summarize what changed to fix a transaction.
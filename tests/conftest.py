@@ -2,11 +2,19 @@
 Shared pytest fixtures for GCGAAP tests.
 """
 
+import shutil
+
 import pytest
 
 from gcgaap.config import GCGAAPConfig
 from gcgaap.entity_map import EntityDefinition, EntityMap
-from tests.helpers import MockBook, make_account, make_split, make_transaction
+from tests.helpers import (
+    MockBook,
+    create_cross_entity_book,
+    make_account,
+    make_split,
+    make_transaction,
+)
 
 
 @pytest.fixture
@@ -104,3 +112,26 @@ def fully_mapped_entity_map(balanced_book_accounts) -> EntityMap:
     }
     account_entities = {acc.guid: "personal" for acc in balanced_book_accounts}
     return EntityMap(entities=entities, account_entities=account_entities)
+
+
+@pytest.fixture(scope="session")
+def cross_entity_book_template(tmp_path_factory):
+    """
+    A generated piecash book (see create_cross_entity_book), built once.
+
+    Returns a (path, account GUIDs by full name) tuple. Tests that modify
+    the book should use *cross_entity_book*, which hands out a copy.
+    """
+    pytest.importorskip("piecash")
+    path = tmp_path_factory.mktemp("books") / "cross_entity.gnucash"
+    guids = create_cross_entity_book(path)
+    return path, guids
+
+
+@pytest.fixture
+def cross_entity_book(cross_entity_book_template, tmp_path):
+    """A private copy of the generated book: (path, account GUIDs by full name)."""
+    template_path, guids = cross_entity_book_template
+    path = tmp_path / template_path.name
+    shutil.copyfile(template_path, path)
+    return path, guids
@@ -3,10 +3,13 @@ Shared test helpers for GCGAAP unit tests.
 
 Provides factory functions for creating test data objects and a MockBook
 that stands in for GnuCashBook without requiring a real GnuCash file or piecash.
+create_cross_entity_book writes a small real book with piecash for the tests
+that exercise SQL queries or writes.
 """
 
 from __future__ import annotations
 
+from gcgaap.entity_map import EntityDefinition, EntityMap
 from gcgaap.gnucash_access import GCAccount, GCTransaction, GCTransactionSplit
 
 
@@ -139,3 +142,110 @@ class MockBook:
                 balances[split.account_guid] = balances.get(split.account_guid, 0.0) + split.value
 
         return balances
+
+
+# ---------------------------------------------------------------------------
+# Generated piecash books
+# ---------------------------------------------------------------------------
+
+
+def create_cross_entity_book(
+    path,
+    two_split_count: int = 4,
+    three_split_count: int = 1,
+) -> dict[str, str]:
+    """
+    Write a small SQLite GnuCash book shared by a personal and a business entity.
+
+    Two-split transactions alternate between the personal checking account
+    paying a business expense and the business bank paying a personal one;
+    three-split transactions have personal checking pay one of each. Each
+    entity has Money In / Money Out equity accounts, and the personal
+    entity also has an INCOME account named like one ("Money In Rewards").
+
+    Requires piecash; callers should skip when it is not installed.
+
+    Returns:
+        Dictionary mapping account full name to GUID.
+    """
+    from datetime import date
+    from decimal import Decimal
+
+    import piecash
+
+    book = piecash.create_book(str(path), currency="USD", overwrite=True)
+    usd = book.default_currency
+
+    def account(name, account_type, parent, placeholder=False):
+        return piecash.Account(name, account_type, usd, parent=parent, placeholder=placeholder)
+
+    assets = account("Assets", "ASSET", book.root_account, placeholder=True)
+    expenses = account("Expenses", "EXPENSE", book.root_account, placeholder=True)
+    income = account("Income", "INCOME", book.root_account, placeholder=True)
+    equity = account("Equity", "EQUITY", book.root_account, placeholder=True)
+    personal_equity = account("Personal", "EQUITY", equity, placeholder=True)
+    biz_equity = account("Biz", "EQUITY", equity, placeholder=True)
+
+    checking = account("Personal Checking", "BANK", assets)
+    biz_bank = account("Biz Bank", "BANK", assets)
+    food = account("Personal Food", "EXPENSE", expenses)
+    supplies = account("Biz Supplies", "EXPENSE", expenses)
+    account("Money In (Biz)", "EQUITY", personal_equity)
+    account("Money Out (Biz)", "EQUITY", personal_equity)
+    account("Money In (Personal)", "EQUITY", biz_equity)
+    account("Money Out (Personal)", "EQUITY", biz_equity)
+    book.flush()
+    # Stored after the equity accounts, so a scan that ignored account
+    # types would see it last and let it win
+    account("Money In Rewards", "INCOME", income)
+    book.flush()
+
+    for i in range(two_split_count):
+        amount = Decimal(10 + i)
+        paid_from, paid_to = (checking, supplies) if i % 2 == 0 else (biz_bank, food)
+        piecash.Transaction(
+            usd,
+            f"Two-split {i}",
+            post_date=date(2024, 1, 1 + i % 28),
+            splits=[piecash.Split(paid_from, -amount), piecash.Split(paid_to, amount)],
+        )
+
+    for i in range(three_split_count):
+        piecash.Transaction(
+            usd,
+            f"Three-split {i}",
+            post_date=date(2024, 2, 1 + i % 28),
+            splits=[
+                piecash.Split(checking, Decimal(-30)),
+                piecash.Split(supplies, Decimal(20)),
+                piecash.Split(food, Decimal(10)),
+            ],
+        )
+
+    book.save()
+    guids = {acc.fullname: acc.guid for acc in book.accounts}
+    book.close()
+    return guids
+
+
+def cross_entity_map(guids: dict[str, str]) -> EntityMap:
+    """
+    EntityMap for a book from create_cross_entity_book.
+
+    Accounts with "Personal" or "Rewards" in their full name belong to
+    'personal', the other leaf accounts to 'biz'; top-level placeholders
+    stay unmapped.
+    """
+    entities = {
+        "personal": EntityDefinition(key="personal", label="Personal", type="individual"),
+        "biz": EntityDefinition(key="biz", label="Biz", type="business"),
+    }
+    account_entities = {}
+    for full_name, guid in guids.items():
+        if ":" not in full_name:
+            continue
+        if "Personal" in full_name.split(":")[1] or "Rewards" in full_name:
+            account_entities[guid] = "personal"
+        else:
+            account_entities[guid] = "biz"
+    return EntityMap(entities=entities, account_entities=account_entities)
@@ -10,15 +10,18 @@ from gcgaap.config import GCGAAPConfig
 from gcgaap.entity_map import EntityDefinition, EntityMap
 from gcgaap.gnucash_access import GCAccount
 from gcgaap.reports.balance_sheet import (
+    AccountBalances,
     BalanceCheckResult,
     BalanceSheet,
     BalanceSheetLine,
+    ImbalanceError,
     check_entity_balance,
     classify_account_type,
     format_as_csv,
     format_as_json,
     format_as_text,
     generate_balance_sheet,
+    precompute_account_balances,
 )
 from tests.helpers import MockBook, make_account
 
@@ -362,6 +365,30 @@ def _make_book_and_map_for_generate():
 MOCK_VALIDATE = "gcgaap.reports.balance_sheet.validate_for_reporting"
 
 
+class TestPrecomputeAccountBalances:
+    def test_collects_accounts_and_balances(self):
+        book, em = _make_book_and_map_for_generate()
+        with patch(MOCK_VALIDATE) as validate:
+            precomputed = precompute_account_balances(book, em, "2024-12-31")
+        validate.assert_called_once()
+        assert isinstance(precomputed, AccountBalances)
+        assert precomputed.as_of_date == date(2024, 12, 31)
+        assert set(precomputed.accounts) == {"acc-asset", "acc-equity", "acc-income", "acc-expense"}
+        assert precomputed.balances["acc-asset"] == pytest.approx(120.0)
+
+    def test_generate_with_precomputed_matches_direct(self):
+        book, em = _make_book_and_map_for_generate()
+        with patch(MOCK_VALIDATE):
+            direct = generate_balance_sheet(book, em, "2024-12-31", entity_key="personal")
+            precomputed = precompute_account_balances(book, em, "2024-12-31")
+        with patch(MOCK_VALIDATE) as validate:
+            cached = generate_balance_sheet(
+                book, em, "2024-12-31", entity_key="personal", precomputed=precomputed
+            )
+        validate.assert_not_called()
+        assert cached == direct
+
+
 class TestGenerateBalanceSheet:
     def test_returns_balance_sheet_instance(self):
         book, em = _make_book_and_map_for_generate()
@@ -462,6 +489,24 @@ class TestGenerateBalanceSheet:
             with pytest.raises(ValueError, match="ACCOUNTING EQUATION VIOLATION"):
                 generate_balance_sheet(book, em, "2024-12-31")
 
+    def test_imbalance_error_carries_totals(self):
+        accounts = [
+            make_account("acc-asset", "Assets:Checking", "BANK"),
+            make_account("acc-equity", "Equity:Opening", "EQUITY"),
+        ]
+        balances = {"acc-asset": 200.0, "acc-equity": -100.0}
+        book = MockBook(accounts=accounts, balances=balances)
+        em = EntityMap(account_entities={"acc-asset": "personal", "acc-equity": "personal"})
+
+        with patch(MOCK_VALIDATE):
+            with pytest.raises(ImbalanceError) as excinfo:
+                generate_balance_sheet(book, em, "2024-12-31")
+
+        assert excinfo.value.assets == pytest.approx(200.0)
+        assert excinfo.value.liabilities == pytest.approx(0.0)
+        assert excinfo.value.equity == pytest.approx(100.0)
+        assert excinfo.value.imbalance == pytest.approx(100.0)
+
     def test_with_liability_account(self):
         """Liability accounts stored as negative display as positive."""
         accounts = [
@@ -570,26 +615,20 @@ class TestCheckEntityBalance:
         assert result.entity_label == "Consolidated (All Entities)"
         assert result.entity_key is None
 
-    def test_parses_imbalance_from_value_error(self):
-        """check_entity_balance extracts numeric values from a ValueError message."""
+    def test_reads_totals_from_imbalance_error(self):
         book, em, config = self._make_balanced_setup()
-        error_msg = (
-            "ACCOUNTING EQUATION VIOLATION: Balance Sheet does not balance!\n"
-            "Assets: 200.00\n"
-            "Liabilities: 50.00\n"
-            "Equity: 100.00\n"
-            "Imbalance (A - L - E): 50.00\n"
-            "This indicates a serious data integrity issue."
+        error = ImbalanceError(
+            "ACCOUNTING EQUATION VIOLATION", assets=200.125, liabilities=50.0,
+            equity=100.0, imbalance=50.125,
         )
 
-        with patch(MOCK_GEN, side_effect=ValueError(error_msg)):
+        with patch(MOCK_GEN, side_effect=error):
             result = check_entity_balance(book, em, "2024-12-31", None, config)
 
         assert result.balanced is False
-        assert result.total_assets == pytest.approx(200.0)
-        assert result.total_liabilities == pytest.approx(50.0)
-        assert result.total_equity == pytest.approx(100.0)
-        assert result.imbalance == pytest.approx(50.0)
+        assert result.total_assets == 200.125
+        assert result.imbalance == 50.125
+        assert result.error is None
 
     def test_stores_generic_value_error_as_error_field(self):
         """ValueError without imbalance format is stored in result.error."""
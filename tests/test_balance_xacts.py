@@ -0,0 +1,305 @@
+"""Tests for gcgaap.balance_xacts."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import click
+import pytest
+
+from gcgaap import balance_xacts
+from gcgaap.balance_xacts import (
+    EquityAccounts,
+    TransactionGroup,
+    _index_transactions,
+    add_balancing_splits,
+    balance_transaction_groups,
+    find_equity_accounts,
+    run_balance_xacts_workflow,
+)
+from gcgaap.cross_entity import (
+    CrossEntityTransaction,
+    SplitInfo,
+    analyze_cross_entity_transactions,
+)
+from gcgaap.gnucash_access import GnuCashBook
+from tests.helpers import cross_entity_map, make_transaction
+
+
+# ---------------------------------------------------------------------------
+# EquityAccounts
+# ---------------------------------------------------------------------------
+
+
+class TestEquityAccounts:
+    def test_both_accounts_found(self):
+        equity = EquityAccounts(entity_key="biz", money_in_guid="in-1", money_out_guid="out-1")
+        assert equity.has_both_accounts() is True
+        assert equity.missing_accounts() == []
+
+    def test_missing_money_out(self):
+        equity = EquityAccounts(entity_key="biz", money_in_guid="in-1")
+        assert equity.has_both_accounts() is False
+        assert equity.missing_accounts() == ["Money Out"]
+
+    def test_missing_both(self):
+        equity = EquityAccounts(entity_key="biz")
+        assert equity.missing_accounts() == ["Money In", "Money Out"]
+
+
+# ---------------------------------------------------------------------------
+# find_equity_accounts
+# ---------------------------------------------------------------------------
+
+
+class TestFindEquityAccounts:
+    def test_finds_money_in_and_out_for_each_entity(self, cross_entity_book_template):
+        path, guids = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            equity = find_equity_accounts(book.piecash_book, cross_entity_map(guids))
+
+        assert equity["personal"].money_in_guid == guids["Equity:Personal:Money In (Biz)"]
+        assert equity["personal"].money_out_guid == guids["Equity:Personal:Money Out (Biz)"]
+        assert equity["biz"].money_in_guid == guids["Equity:Biz:Money In (Personal)"]
+        assert equity["biz"].money_out_guid == guids["Equity:Biz:Money Out (Personal)"]
+
+    def test_ignores_non_equity_account_named_money_in(self, cross_entity_book_template):
+        path, guids = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            equity = find_equity_accounts(book.piecash_book, cross_entity_map(guids))
+
+        # Income:Money In Rewards belongs to 'personal' but is not EQUITY
+        assert equity["personal"].money_in_name == "Equity:Personal:Money In (Biz)"
+        found = {
+            guid
+            for accounts in equity.values()
+            for guid in (accounts.money_in_guid, accounts.money_out_guid)
+        }
+        assert guids["Income:Money In Rewards"] not in found
+
+# ---------------------------------------------------------------------------
+# _index_transactions / add_balancing_splits
+# ---------------------------------------------------------------------------
+
+
+def _two_split_transactions(book, guids) -> list[CrossEntityTransaction]:
+    """Cross-entity 2-split transactions of the generated book, in date order."""
+    analysis = analyze_cross_entity_transactions(book, cross_entity_map(guids), split_count=2)
+    return sorted(analysis.cross_entity_transactions, key=lambda t: t.post_date)
+
+
+class TestIndexTransactions:
+    def test_indexes_guids_across_batches(self, cross_entity_book_template):
+        path, guids = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            real = [t.transaction.guid for t in _two_split_transactions(book, guids)]
+            # Unknown GUIDs fill the first batch so the real ones land past it
+            unknown = [f"{i:032x}" for i in range(balance_xacts._GUID_BATCH_SIZE + 50)]
+            index = _index_transactions(book.piecash_book, unknown + real)
+
+            assert len(unknown) > balance_xacts._GUID_BATCH_SIZE
+            assert sorted(index) == sorted(real)
+            assert all(index[guid].guid == guid for guid in real)
+
+    def test_transaction_missing_from_index_is_not_balanced(self, cross_entity_book):
+        path, guids = cross_entity_book
+        entity_map = cross_entity_map(guids)
+
+        with GnuCashBook(path, readonly=False) as book:
+            book_obj = book.piecash_book
+            target, *others = _two_split_transactions(book, guids)
+            index = _index_transactions(book_obj, [t.transaction.guid for t in others])
+
+            result = add_balancing_splits(
+                book_obj,
+                target,
+                find_equity_accounts(book_obj, entity_map),
+                {account.guid: account for account in book_obj.accounts},
+                index,
+            )
+
+            assert target.transaction.guid not in index
+            assert result is False
+
+    def test_indexed_transaction_gets_balancing_splits(self, cross_entity_book):
+        path, guids = cross_entity_book
+        entity_map = cross_entity_map(guids)
+
+        with GnuCashBook(path, readonly=False) as book:
+            book_obj = book.piecash_book
+            target = _two_split_transactions(book, guids)[0]
+            index = _index_transactions(book_obj, [target.transaction.guid])
+
+            result = add_balancing_splits(
+                book_obj,
+                target,
+                find_equity_accounts(book_obj, entity_map),
+                {account.guid: account for account in book_obj.accounts},
+                index,
+            )
+
+            assert result is True
+            assert len(index[target.transaction.guid].splits) == 4
+
+# ---------------------------------------------------------------------------
+# balance_transaction_groups
+# ---------------------------------------------------------------------------
+
+
+class _FakeBook:
+    """Stand-in for a piecash Book that records saves and rollbacks."""
+
+    def __init__(self, fail_first_save: bool = False):
+        self.accounts = []
+        self.session = MagicMock()
+        self.saved_at = []  # balanced-transaction count at each successful save
+        self.balanced = 0
+        self._fail_next_save = fail_first_save
+
+    def save(self):
+        if self._fail_next_save:
+            self._fail_next_save = False
+            raise RuntimeError("database is locked")
+        self.saved_at.append(self.balanced)
+
+    def flush(self):
+        pass
+
+
+def _cross_txn(guid: str) -> CrossEntityTransaction:
+    """Build a 2-split personal/business transaction with a $10 imbalance."""
+    return CrossEntityTransaction(
+        transaction=make_transaction(guid, "2024-01-15", f"Txn {guid}", []),
+        entities_involved={"personal", "business"},
+        entity_amounts={"personal": Decimal("-10"), "business": Decimal("10")},
+        description=f"Txn {guid}",
+        post_date=date(2024, 1, 15),
+        splits_info=[
+            SplitInfo("Assets:Checking", "acc-asset", "personal", Decimal("-10")),
+            SplitInfo("Expenses:Biz Supplies", "acc-biz", "business", Decimal("10")),
+        ],
+        expense_account_name="Expenses:Biz Supplies",
+    )
+
+
+def _groups(*sizes: int) -> list[TransactionGroup]:
+    """One group per size, each holding that many transactions."""
+    groups = []
+    for g, size in enumerate(sizes):
+        txns = [_cross_txn(f"t{g}-{i}") for i in range(size)]
+        groups.append(TransactionGroup(("business", "personal"), "Expenses:Biz Supplies", txns))
+    return groups
+
+
+@pytest.fixture
+def fake_balancing(monkeypatch):
+    """Balance every transaction without touching piecash."""
+    def add_splits(book_obj, txn, *args, dry_run=False):
+        if not dry_run:
+            book_obj.balanced += 1
+        return True
+
+    monkeypatch.setattr(balance_xacts, "add_balancing_splits", add_splits)
+    monkeypatch.setattr(balance_xacts, "_index_transactions", lambda book_obj, guids: {})
+
+
+class TestBalanceTransactionGroups:
+    def test_dry_run_never_saves(self, fake_balancing, monkeypatch):
+        monkeypatch.setattr(click, "confirm", MagicMock(side_effect=AssertionError("prompted")))
+        book = _FakeBook()
+
+        result = balance_transaction_groups(book, _groups(2, 3), {}, dry_run=True, save_every=1)
+
+        assert result == (5, 0)
+        assert book.saved_at == []
+
+    def test_save_every_zero_saves_once_at_end(self, fake_balancing, monkeypatch):
+        monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+        book = _FakeBook()
+
+        result = balance_transaction_groups(book, _groups(2, 3, 1), {})
+
+        assert result == (6, 0)
+        assert book.saved_at == [6]
+
+    def test_save_every_n_saves_in_batches(self, fake_balancing, monkeypatch):
+        monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+        book = _FakeBook()
+
+        result = balance_transaction_groups(book, _groups(1, 1, 1, 1, 1), {}, save_every=2)
+
+        assert result == (5, 0)
+        assert book.saved_at == [2, 4, 5]
+
+    def test_abort_saves_groups_already_approved(self, fake_balancing, monkeypatch):
+        monkeypatch.setattr(click, "confirm", MagicMock(side_effect=[True, click.Abort()]))
+        book = _FakeBook()
+
+        with pytest.raises(click.Abort):
+            balance_transaction_groups(book, _groups(2, 3), {})
+
+        assert book.saved_at == [2]
+
+    def test_failed_save_rolls_back_and_next_batch_saves(self, fake_balancing, monkeypatch):
+        monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+        book = _FakeBook(fail_first_save=True)
+
+        result = balance_transaction_groups(book, _groups(2, 3), {}, save_every=1)
+
+        book.session.rollback.assert_called_once_with()
+        assert result == (3, 2)
+        assert book.saved_at == [5]
+
+
+# ---------------------------------------------------------------------------
+# run_balance_xacts_workflow
+# ---------------------------------------------------------------------------
+
+
+class TestRunBalanceXactsWorkflow:
+    def test_dry_run_leaves_book_unchanged(self, cross_entity_book, monkeypatch):
+        monkeypatch.setattr(click, "confirm", MagicMock(side_effect=AssertionError("prompted")))
+        path, guids = cross_entity_book
+        original = path.read_bytes()
+
+        result = run_balance_xacts_workflow(
+            path, cross_entity_map(guids), None, None, None, dry_run=True
+        )
+
+        assert result == (4, 0, None)
+        assert path.read_bytes() == original
+
+    def test_real_run_adds_balancing_splits(self, cross_entity_book, monkeypatch):
+        monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+        path, guids = cross_entity_book
+
+        fixed, failed, _ = run_balance_xacts_workflow(
+            path, cross_entity_map(guids), None, None, None, dry_run=False
+        )
+
+        assert (fixed, failed) == (4, 0)
+        with GnuCashBook(path) as book:
+            split_counts = {t.description: len(t.splits) for t in book.iter_transactions()}
+        assert split_counts == {
+            "Two-split 0": 4,
+            "Two-split 1": 4,
+            "Two-split 2": 4,
+            "Two-split 3": 4,
+            "Three-split 0": 3,
+        }
+
+    def test_backup_is_written_before_book_is_modified(self, cross_entity_book, monkeypatch):
+        monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+        path, guids = cross_entity_book
+        original = path.read_bytes()
+
+        _, _, backup_path = run_balance_xacts_workflow(
+            path, cross_entity_map(guids), None, None, None, dry_run=False
+        )
+
+        assert backup_path is not None
+        assert backup_path.read_bytes() == original
+        assert path.read_bytes() != original
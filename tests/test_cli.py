@@ -85,6 +85,65 @@ class TestReportGroup:
         result = runner.invoke(main, ["report", "balance-check", "--help"])
         assert result.exit_code == 0
 
+    def test_report_balance_check_quick_skips_entities(self, runner, tmp_path):
+        """--quick stops after a balanced consolidated check."""
+        from gcgaap.entity_map import EntityDefinition, EntityMap
+        from gcgaap.reports.balance_sheet import BalanceCheckResult
+        from tests.helpers import MockBook
+
+        book_file = tmp_path / "test.gnucash"
+        book_file.touch()
+        entity_map = EntityMap(
+            entities={"personal": EntityDefinition("personal", "Personal", "individual")}
+        )
+        consolidated = BalanceCheckResult(
+            entity_key=None, entity_label="Consolidated (All Entities)", balanced=True
+        )
+
+        with patch("gcgaap.commands.report.GnuCashBook", return_value=MockBook()):
+            with patch("gcgaap.commands.report.EntityMap") as mock_em_class:
+                mock_em_class.load.return_value = entity_map
+                with patch("gcgaap.reports.balance_sheet.precompute_account_balances"):
+                    with patch(
+                        "gcgaap.reports.balance_sheet.check_entity_balance",
+                        return_value=consolidated,
+                    ) as mock_check:
+                        result = runner.invoke(
+                            main,
+                            ["report", "balance-check", "--file", str(book_file),
+                             "--as-of", "2024-12-31", "--quick"],
+                        )
+
+        assert result.exit_code == 0
+        assert "per-entity check skipped" in result.output
+        assert "Checking Personal" not in result.output
+        mock_check.assert_called_once()
+
+    def test_report_balance_check_invalid_as_of_reports_each_entity(
+        self, runner, tmp_path, balanced_mock_book, fully_mapped_entity_map
+    ):
+        """An invalid --as-of date is listed as an error row for every entity."""
+        book_file = tmp_path / "test.gnucash"
+        book_file.touch()
+
+        with patch("gcgaap.commands.report.GnuCashBook", return_value=balanced_mock_book):
+            with patch("gcgaap.commands.report.EntityMap") as mock_em_class:
+                mock_em_class.load.return_value = fully_mapped_entity_map
+                result = runner.invoke(
+                    main,
+                    ["report", "balance-check", "--file", str(book_file),
+                     "--as-of", "2024-13-45"],
+                )
+
+        assert result.exit_code == 1
+        assert "SUMMARY" in result.output
+        assert "Balance check failed" not in result.output
+        error_rows = [line for line in result.output.splitlines() if "ERROR:" in line]
+        assert len(error_rows) == 2
+        assert "Consolidated (All Entities)" in error_rows[0]
+        assert "Personal" in error_rows[1]
+        assert all("Invalid date format" in line for line in error_rows)
+
 
 # ---------------------------------------------------------------------------
 # xact subgroup
@@ -226,3 +285,22 @@ class TestDbGroup:
     def test_db_diff_snapshots_help(self, runner):
         result = runner.invoke(main, ["db", "diff-snapshots", "--help"])
         assert result.exit_code == 0
+
+    def test_db_diff_snapshots_same_records_reports_after_timestamp(self, runner, tmp_path):
+        """Snapshots that differ only by timestamp diff cleanly with both times shown."""
+        from gcgaap.snapshot import DatabaseSnapshot
+
+        before_file, after_file = tmp_path / "before.json", tmp_path / "after.json"
+        for path, timestamp in ((before_file, "2024-01-15T10:30:00"),
+                                (after_file, "2024-01-15T11:45:00")):
+            snapshot = DatabaseSnapshot()
+            snapshot.timestamp = timestamp
+            snapshot.save(path)
+
+        result = runner.invoke(
+            main, ["db", "diff-snapshots", "-b", str(before_file), "-a", str(after_file)]
+        )
+
+        assert result.exit_code == 0
+        assert "Before: 2024-01-15T10:30:00" in result.output
+        assert "After:  2024-01-15T11:45:00" in result.output
@@ -0,0 +1,272 @@
+"""
+Tests for columbo — snapshot loading and incremental capture.
+
+Loading is tested with snapshots built in memory. Capture uses a generated
+piecash book, edits it, and captures it again with previous= to check
+which transactions are re-read.
+"""
+
+import json
+import pickle
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+import columbo
+
+
+def _snapshot(description: str = "Groceries") -> columbo.DatabaseSnapshot:
+    snapshot = columbo.DatabaseSnapshot()
+    snapshot.accounts["acc-1"] = columbo.AccountSnapshot(
+        guid="acc-1",
+        full_name="Assets:Checking",
+        type="BANK",
+        commodity_symbol="USD",
+        parent_guid=None,
+        balance=90.0,
+    )
+    snapshot.transactions["tx-1"] = columbo.TransactionSnapshot(
+        guid="tx-1",
+        description=description,
+        post_date="2024-01-15 10:30:00",
+        enter_date="2024-01-15 10:31:00",
+        split_count=3,
+        splits=[
+            columbo.SplitRecord("acc-1", "Checking", -10.0, -10.0, None, "n"),
+            columbo.SplitRecord("acc-2", "Food", 10.0, 10.0, "Lunch", "c"),
+            columbo.SplitRecord(error="Error reading split: bad value"),
+        ],
+        row_hash="abc123",
+    )
+    return snapshot
+
+
+def _open_writable(path):
+    piecash = pytest.importorskip("piecash")
+    return piecash.open_book(str(path), readonly=False, do_backup=False, open_if_lock=True)
+
+
+class TestSplitRecords:
+    def test_arrays_in_current_field_order(self):
+        rows = [["acc-1", "Checking", -10.0, -10.0, None, "n", None]]
+
+        records = columbo._split_records(rows, list(columbo.SplitRecord._fields))
+
+        assert records == [columbo.SplitRecord("acc-1", "Checking", -10.0, -10.0, None, "n")]
+        assert all(isinstance(record, columbo.SplitRecord) for record in records)
+
+    def test_arrays_in_other_field_order(self):
+        rows = [["n", "acc-1", -10.0]]
+
+        records = columbo._split_records(rows, ["reconcile_state", "account_guid", "value"])
+
+        assert records == [
+            columbo.SplitRecord(account_guid="acc-1", value=-10.0, reconcile_state="n")
+        ]
+
+    def test_legacy_dict_splits(self):
+        rows = [
+            {
+                "account_guid": "acc-1",
+                "account_name": "Checking",
+                "value": -10.0,
+                "quantity": -10.0,
+                "memo": None,
+                "reconcile_state": "n",
+            },
+            {"error": "Error reading split: bad value"},
+        ]
+
+        records = columbo._split_records(rows, None)
+
+        assert records == [
+            columbo.SplitRecord("acc-1", "Checking", -10.0, -10.0, None, "n"),
+            columbo.SplitRecord(error="Error reading split: bad value"),
+        ]
+
+    def test_legacy_json_snapshot_loads(self, tmp_path):
+        """A snapshot saved before split_fields existed stores splits as dicts."""
+        path = tmp_path / "snapshot_before.json"
+        expected = _snapshot()
+        data = {
+            "timestamp": expected.timestamp,
+            "metadata": expected.metadata,
+            "accounts": {guid: acc.to_dict() for guid, acc in expected.accounts.items()},
+            "transactions": {
+                guid: {**trans.to_dict(), "splits": [s._asdict() for s in trans.splits]}
+                for guid, trans in expected.transactions.items()
+            },
+        }
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        loaded = columbo.DatabaseSnapshot.load(path)
+
+        assert loaded.transactions == expected.transactions
+
+
+class TestSaveLoad:
+    @pytest.mark.parametrize("suffix", [".json", columbo.MSGPACK_SUFFIX])
+    def test_round_trip(self, tmp_path, suffix):
+        if suffix == columbo.MSGPACK_SUFFIX:
+            pytest.importorskip("msgpack")
+        snapshot = _snapshot()
+        path = tmp_path / f"snapshot_before{suffix}"
+
+        snapshot.save(path)
+        loaded = columbo.DatabaseSnapshot.load(path)
+
+        assert loaded.timestamp == snapshot.timestamp
+        assert loaded.metadata == snapshot.metadata
+        assert loaded.accounts == snapshot.accounts
+        assert loaded.transactions == snapshot.transactions
+        assert loaded.transactions["tx-1"].row_hash == "abc123"
+        assert all(
+            isinstance(split, columbo.SplitRecord)
+            for split in loaded.transactions["tx-1"].splits
+        )
+
+    def test_json_stores_splits_as_arrays(self, tmp_path):
+        path = tmp_path / "snapshot_before.json"
+
+        _snapshot().save(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+        assert data["split_fields"] == list(columbo.SplitRecord._fields)
+        assert data["transactions"]["tx-1"]["splits"][1] == [
+            "acc-2", "Food", 10.0, 10.0, "Lunch", "c", None
+        ]
+
+
+class TestSnapshotCache:
+    def _saved(self, tmp_path, snapshot=None):
+        path = tmp_path / "snapshot_before.json"
+        (snapshot or _snapshot()).save(path)
+        return path
+
+    def _replace_cached_snapshot(self, path, snapshot):
+        """Keep the sidecar's key but swap in a different snapshot."""
+        cache_file = path.with_name(path.name + ".pkl")
+        with open(cache_file, 'rb') as f:
+            cache_key, _ = pickle.load(f)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((cache_key, snapshot), f)
+
+    def test_cache_is_off_by_default(self, tmp_path):
+        path = self._saved(tmp_path)
+        columbo.DatabaseSnapshot.load(path, use_cache=True)
+        self._replace_cached_snapshot(path, _snapshot("From the cache"))
+
+        loaded = columbo.DatabaseSnapshot.load(path)
+
+        assert loaded.transactions["tx-1"].description == "Groceries"
+
+    def test_no_sidecar_written_by_default(self, tmp_path):
+        path = self._saved(tmp_path)
+
+        columbo.DatabaseSnapshot.load(path)
+
+        assert not path.with_name(path.name + ".pkl").exists()
+
+    def test_cached_snapshot_is_reused(self, tmp_path):
+        path = self._saved(tmp_path)
+        columbo.DatabaseSnapshot.load(path, use_cache=True)
+        self._replace_cached_snapshot(path, _snapshot("From the cache"))
+
+        loaded = columbo.DatabaseSnapshot.load(path, use_cache=True)
+
+        assert loaded.transactions["tx-1"].description == "From the cache"
+
+    def test_corrupt_sidecar_falls_back_to_parsing(self, tmp_path):
+        path = self._saved(tmp_path)
+        cache_file = path.with_name(path.name + ".pkl")
+        cache_file.write_bytes(b"not a pickle")
+
+        loaded = columbo.DatabaseSnapshot.load(path, use_cache=True)
+
+        assert loaded.transactions == _snapshot().transactions
+        with open(cache_file, 'rb') as f:
+            _, cached = pickle.load(f)
+        assert cached.transactions == loaded.transactions
+
+    def test_stale_sidecar_is_ignored(self, tmp_path):
+        path = self._saved(tmp_path)
+        columbo.DatabaseSnapshot.load(path, use_cache=True)
+        self._saved(tmp_path, _snapshot("Groceries and fuel"))
+
+        loaded = columbo.DatabaseSnapshot.load(path, use_cache=True)
+
+        assert loaded.transactions["tx-1"].description == "Groceries and fuel"
+
+
+@pytest.fixture
+def book_with_gift(cross_entity_book):
+    """
+    The generated book plus a "Gift" transaction whose expense account no
+    other transaction uses, so renaming that account touches only it.
+    """
+    piecash = pytest.importorskip("piecash")
+    path, _ = cross_entity_book
+    book = _open_writable(path)
+    try:
+        accounts = {account.fullname: account for account in book.accounts}
+        gifts = piecash.Account(
+            "Gifts", "EXPENSE", book.default_currency, parent=accounts["Expenses"]
+        )
+        piecash.Transaction(
+            book.default_currency,
+            "Gift",
+            post_date=date(2024, 3, 1),
+            splits=[
+                piecash.Split(accounts["Assets:Personal Checking"], Decimal(-25)),
+                piecash.Split(gifts, Decimal(25)),
+            ],
+        )
+        book.save()
+    finally:
+        book.close()
+    return path
+
+
+def _guids_by_description(snapshot) -> dict[str, str]:
+    return {t.description: guid for guid, t in snapshot.transactions.items()}
+
+
+class TestIncrementalCapture:
+    def test_only_edited_transactions_are_recaptured(self, book_with_gift):
+        path = book_with_gift
+        before = columbo.DatabaseSnapshot.capture(path)
+        guids = _guids_by_description(before)
+
+        book = _open_writable(path)
+        try:
+            transactions = {t.guid: t for t in book.transactions}
+            # Renamed transaction
+            transactions[guids["Two-split 0"]].description = "Two-split 0 (renamed)"
+            # Changed split values (both sides, so the transaction stays balanced)
+            for split in transactions[guids["Two-split 1"]].splits:
+                split.value = split.value * 2
+                split.quantity = split.quantity * 2
+            # Renamed account, used only by the gift transaction
+            accounts = {account.fullname: account for account in book.accounts}
+            accounts["Expenses:Gifts"].name = "Presents"
+            book.save()
+        finally:
+            book.close()
+
+        after = columbo.DatabaseSnapshot.capture(path, previous=before)
+
+        edited = {guids["Two-split 0"], guids["Two-split 1"], guids["Gift"]}
+        assert set(after.transactions) == set(before.transactions)
+        for guid, snapshot in after.transactions.items():
+            if guid in edited:
+                assert snapshot is not before.transactions[guid]
+                assert snapshot.row_hash != before.transactions[guid].row_hash
+            else:
+                assert snapshot is before.transactions[guid]
+
+        assert after.transactions[guids["Two-split 0"]].description == "Two-split 0 (renamed)"
+        values_before = [s.value for s in before.transactions[guids["Two-split 1"]].splits]
+        values_after = [s.value for s in after.transactions[guids["Two-split 1"]].splits]
+        assert sorted(values_after) == sorted(2 * value for value in values_before)
+        assert "Presents" in {s.account_name for s in after.transactions[guids["Gift"]].splits}
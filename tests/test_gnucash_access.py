@@ -14,6 +14,7 @@ from gcgaap.gnucash_access import (
     GnuCashBook,
     parse_date,
 )
+from tests.helpers import cross_entity_map
 
 
 # ---------------------------------------------------------------------------
@@ -203,6 +204,11 @@ class TestGnuCashBookErrors:
         with pytest.raises(RuntimeError, match="not opened"):
             book.get_account_balances(date.today())
 
+    def test_piecash_book_requires_open_book(self, tmp_path):
+        book = GnuCashBook(tmp_path / "book.gnucash")
+        with pytest.raises(RuntimeError, match="not opened"):
+            book.piecash_book
+
 
 def _make_mock_piecash_account(
     guid: str,
@@ -267,6 +273,20 @@ def _make_mock_piecash_transaction(
     return mock_txn
 
 
+def _make_mock_piecash_book(transactions: list) -> MagicMock:
+    """
+    Build a mock piecash book holding the given transactions.
+
+    They are returned both by the batched split preload and by the lazy
+    book.transactions fallback.
+    """
+    mock_piecash_book = MagicMock()
+    mock_piecash_book.transactions = transactions
+    preload_query = mock_piecash_book.session.query.return_value.options.return_value
+    preload_query.all.return_value = transactions
+    return mock_piecash_book
+
+
 class TestGnuCashBookIterAccounts:
     def test_converts_piecash_account_to_gc_account(self, tmp_path):
         """iter_accounts converts piecash account objects into GCAccount instances."""
@@ -362,8 +382,7 @@ class TestGnuCashBookIterTransactions:
                 ("acc-002", "Income", -1000.0, -1000.0, None),
             ],
         )
-        mock_piecash_book = MagicMock()
-        mock_piecash_book.transactions = [mock_txn]
+        mock_piecash_book = _make_mock_piecash_book([mock_txn])
 
         book = GnuCashBook(book_file)
         book._book = mock_piecash_book
@@ -381,6 +400,28 @@ class TestGnuCashBookIterTransactions:
         assert txn.splits[1].value == pytest.approx(-1000.0)
         assert txn.splits[1].memo is None
 
+    def test_failed_split_preload_falls_back_to_lazy_loading(self, tmp_path):
+        """An unreadable split row in the batched preload does not stop iteration."""
+        book_file = tmp_path / "book.gnucash"
+        book_file.touch()
+
+        mock_txn = _make_mock_piecash_transaction(
+            "txn-001",
+            "Paycheck",
+            "2024-01-15",
+            [("acc-001", "Checking", 1000.0, 1000.0, None)],
+        )
+        mock_piecash_book = _make_mock_piecash_book([mock_txn])
+        preload_query = mock_piecash_book.session.query.return_value.options.return_value
+        preload_query.all.side_effect = ValueError("Couldn't parse datetime string: ''")
+
+        book = GnuCashBook(book_file)
+        book._book = mock_piecash_book
+
+        transactions = list(book.iter_transactions())
+
+        assert [txn.guid for txn in transactions] == ["txn-001"]
+
     def test_bad_date_transaction_causes_value_error(self, tmp_path):
         """iter_transactions raises ValueError after encountering a bad-date transaction."""
         book_file = tmp_path / "book.gnucash"
@@ -403,8 +444,7 @@ class TestGnuCashBookIterTransactions:
         mock_txn.post_date = bad_post_date
         mock_txn.splits = [mock_split]
 
-        mock_piecash_book = MagicMock()
-        mock_piecash_book.transactions = [mock_txn]
+        mock_piecash_book = _make_mock_piecash_book([mock_txn])
 
         book = GnuCashBook(book_file)
         book._book = mock_piecash_book
@@ -442,8 +482,7 @@ class TestGnuCashBookIterTransactions:
         bad_txn.post_date = bad_post_date
         bad_txn.splits = [bad_split]
 
-        mock_piecash_book = MagicMock()
-        mock_piecash_book.transactions = [good_txn, bad_txn]
+        mock_piecash_book = _make_mock_piecash_book([good_txn, bad_txn])
 
         book = GnuCashBook(book_file)
         book._book = mock_piecash_book
@@ -516,6 +555,54 @@ class TestGnuCashBookContextManager:
         assert book._book is None
 
 
+class TestIterTransactionsSplitCount:
+    """split_count prefilters transactions in SQL on a generated book."""
+
+    def test_without_split_count_reads_every_transaction(self, cross_entity_book_template):
+        path, _ = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            transactions = list(book.iter_transactions())
+
+        assert len(transactions) == 5
+
+    def test_split_count_two_reads_only_two_split_transactions(self, cross_entity_book_template):
+        path, _ = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            transactions = list(book.iter_transactions(split_count=2))
+
+        assert len(transactions) == 4
+        assert all(len(t.splits) == 2 for t in transactions)
+        assert all(t.description.startswith("Two-split") for t in transactions)
+
+    def test_split_count_three_reads_only_three_split_transactions(
+        self, cross_entity_book_template
+    ):
+        path, _ = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            transactions = list(book.iter_transactions(split_count=3))
+
+        assert [t.description for t in transactions] == ["Three-split 0"]
+        assert len(transactions[0].splits) == 3
+
+    def test_cross_entity_analysis_honours_split_count(self, cross_entity_book_template):
+        from gcgaap.cross_entity import analyze_cross_entity_transactions
+
+        path, guids = cross_entity_book_template
+
+        with GnuCashBook(path) as book:
+            everything = analyze_cross_entity_transactions(book, cross_entity_map(guids))
+            two_split = analyze_cross_entity_transactions(
+                book, cross_entity_map(guids), split_count=2
+            )
+
+        assert len(everything.cross_entity_transactions) == 5
+        assert len(two_split.cross_entity_transactions) == 4
+        assert all(len(t.splits_info) == 2 for t in two_split.cross_entity_transactions)
+
+
 # ---------------------------------------------------------------------------
 # parse_date
 # ---------------------------------------------------------------------------
@@ -534,6 +621,9 @@ class TestParseDate:
         d = parse_date("2025-01-01")
         assert d == date(2025, 1, 1)
 
+    def test_unpadded_fields_still_accepted(self):
+        assert parse_date("2024-1-5") == date(2024, 1, 5)
+
     def test_wrong_format_raises_value_error(self):
         with pytest.raises(ValueError, match="Invalid date format"):
             parse_date("01/15/2024")
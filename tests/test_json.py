@@ -0,0 +1,43 @@
+"""Tests for gcgaap._json."""
+
+import json
+
+import pytest
+
+from gcgaap import _json
+
+
+SAMPLE = {
+    "summary": {"accounts_added": 1, "ratio": 0.25},
+    "entities": {"café": [{"guid": "abc", "name": "Équité", "memo": None}]},
+    "empty": [],
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the json fallback."""
+    if request.param == "orjson":
+        if _json.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return _json
+
+
+class TestDumps:
+    def test_indented_matches_stdlib(self, backend):
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode("utf-8")
+        assert backend.dumps(SAMPLE, indent=True) == expected
+
+    def test_compact_round_trips(self, backend):
+        assert json.loads(backend.dumps(SAMPLE)) == SAMPLE
+
+
+class TestLoads:
+    def test_decodes_utf8_bytes(self, backend):
+        assert backend.loads(json.dumps(SAMPLE, ensure_ascii=False).encode("utf-8")) == SAMPLE
+
+    def test_invalid_document_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            backend.loads(b"{not json")
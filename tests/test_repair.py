@@ -1,5 +1,6 @@
 """Tests for gcgaap.repair."""
 
+import sqlite3
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
@@ -99,7 +100,9 @@ class TestCreateBackup:
 
 
 class TestDiagnoseEmptyReconcileDates:
-    def _setup_mock_conn(self, count: int, descriptions: list[str]) -> MagicMock:
+    def _setup_mock_conn(
+        self, count: int, descriptions: list[str], description_count: int | None = None
+    ) -> MagicMock:
         """Build a mock sqlite3 connection for diagnose tests."""
         mock_cursor = MagicMock()
         mock_conn = MagicMock()
@@ -107,11 +110,14 @@ class TestDiagnoseEmptyReconcileDates:
         mock_conn.__enter__ = lambda s: s
         mock_conn.__exit__ = MagicMock(return_value=False)
 
-        # fetchone returns a dict-like row for row_factory = sqlite3.Row pattern
-        count_row = {"count": count}
+        if description_count is None:
+            description_count = len(descriptions)
+
+        # fetchone returns a dict-like row for row_factory = sqlite3.Row pattern:
+        # split count first, then distinct description count
         desc_rows = [{"description": d} for d in descriptions]
 
-        mock_cursor.fetchone.return_value = count_row
+        mock_cursor.fetchone.side_effect = [{"count": count}, {"count": description_count}]
         mock_cursor.fetchall.return_value = desc_rows
 
         return mock_conn
@@ -123,11 +129,29 @@ class TestDiagnoseEmptyReconcileDates:
         mock_conn = self._setup_mock_conn(3, ["Txn A", "Txn B"])
 
         with patch("gcgaap.repair.sqlite3.connect", return_value=mock_conn):
-            count, descs = diagnose_empty_reconcile_dates(db_path)
+            count, description_count, descs = diagnose_empty_reconcile_dates(db_path)
 
         assert count == 3
+        assert description_count == 2
         assert descs == ["Txn A", "Txn B"]
 
+    def test_description_count_can_exceed_sample(self, tmp_path):
+        db_path = tmp_path / "book.gnucash"
+        db_path.touch()
+
+        mock_conn = self._setup_mock_conn(40, ["Txn A", "Txn B"], description_count=25)
+
+        with patch("gcgaap.repair.sqlite3.connect", return_value=mock_conn):
+            count, description_count, descs = diagnose_empty_reconcile_dates(
+                db_path, sample_size=2
+            )
+
+        assert description_count == 25
+        assert descs == ["Txn A", "Txn B"]
+        sample_sql, params = mock_conn.cursor.return_value.execute.call_args.args
+        assert "LIMIT ?" in sample_sql
+        assert params == (2,)
+
     def test_connection_closed_after_diagnosis(self, tmp_path):
         db_path = tmp_path / "book.gnucash"
         db_path.touch()
@@ -146,11 +170,32 @@ class TestDiagnoseEmptyReconcileDates:
         mock_conn = self._setup_mock_conn(0, [])
 
         with patch("gcgaap.repair.sqlite3.connect", return_value=mock_conn):
-            count, descs = diagnose_empty_reconcile_dates(db_path)
+            count, description_count, descs = diagnose_empty_reconcile_dates(db_path)
 
         assert count == 0
+        assert description_count == 0
         assert descs == []
 
+    def test_null_description_counted_like_sample(self, tmp_path):
+        """A NULL description is counted, matching the sampled descriptions."""
+        db_path = tmp_path / "book.gnucash"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript("""
+            CREATE TABLE transactions (guid TEXT PRIMARY KEY, description TEXT);
+            CREATE TABLE splits (guid TEXT PRIMARY KEY, tx_guid TEXT, reconcile_date TEXT);
+            INSERT INTO transactions VALUES ('t1', 'Txn A'), ('t2', NULL);
+            INSERT INTO splits VALUES
+                ('s1', 't1', ''), ('s2', 't1', ''), ('s3', 't2', ''), ('s4', 't2', NULL);
+        """)
+        conn.commit()
+        conn.close()
+
+        count, description_count, descs = diagnose_empty_reconcile_dates(db_path)
+
+        assert count == 3
+        assert description_count == 2
+        assert descs == [None, "Txn A"]
+
 
 # ---------------------------------------------------------------------------
 # repair_empty_reconcile_dates
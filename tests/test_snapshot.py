@@ -0,0 +1,303 @@
+"""
+Tests for gcgaap.snapshot — snapshot serialization and comparison.
+
+Snapshots are built directly from AccountSnapshot / TransactionSnapshot
+objects so no GnuCash book or piecash install is required.
+"""
+
+import json
+from datetime import date, datetime, timezone
+
+from gcgaap.snapshot import (
+    AccountSnapshot,
+    DatabaseSnapshot,
+    TransactionSnapshot,
+    _format_timestamp,
+    compare_snapshots,
+    format_comparison_text,
+    read_snapshot_timestamp,
+    snapshot_payloads_identical,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _account(guid: str = "acc-1", full_name: str = "Assets:Checking") -> AccountSnapshot:
+    return AccountSnapshot(
+        guid=guid,
+        full_name=full_name,
+        type="BANK",
+        commodity_symbol="USD",
+        parent_guid=None,
+    )
+
+
+def _transaction(
+    guid: str = "tx-1",
+    description: str = "Groceries",
+    error: str | None = None,
+    value: float = 10.0,
+) -> TransactionSnapshot:
+    splits = [
+        {
+            "account_guid": "acc-1",
+            "account_name": "Checking",
+            "value": -value,
+            "quantity": -value,
+            "memo": None,
+            "reconcile_state": "n",
+        },
+        {
+            "account_guid": "acc-2",
+            "account_name": "Food",
+            "value": value,
+            "quantity": value,
+            "memo": None,
+            "reconcile_state": "n",
+        },
+    ]
+    return TransactionSnapshot(
+        guid=guid,
+        description=description,
+        post_date="2024-01-15 10:30:00",
+        enter_date="2024-01-15 10:31:00",
+        split_count=len(splits),
+        splits=splits,
+        error=error,
+    )
+
+
+def _snapshot(accounts=(), transactions=()) -> DatabaseSnapshot:
+    snapshot = DatabaseSnapshot()
+    for account in accounts:
+        snapshot.accounts[account.guid] = account
+    for transaction in transactions:
+        snapshot.transactions[transaction.guid] = transaction
+    return snapshot
+
+
+# ---------------------------------------------------------------------------
+# to_dict
+# ---------------------------------------------------------------------------
+
+
+class TestToDict:
+    def test_account_to_dict_has_all_fields(self):
+        data = _account().to_dict()
+        assert data == {
+            "guid": "acc-1",
+            "full_name": "Assets:Checking",
+            "type": "BANK",
+            "commodity_symbol": "USD",
+            "parent_guid": None,
+            "balance": None,
+        }
+
+    def test_account_to_dict_round_trips(self):
+        account = _account()
+        assert AccountSnapshot(**account.to_dict()) == account
+
+    def test_transaction_to_dict_round_trips(self):
+        transaction = _transaction(error="post_date: bad")
+        assert TransactionSnapshot(**transaction.to_dict()) == transaction
+
+
+# ---------------------------------------------------------------------------
+# _format_timestamp
+# ---------------------------------------------------------------------------
+
+
+class TestFormatTimestamp:
+    def test_date_matches_strftime(self):
+        value = date(2024, 1, 15)
+        assert _format_timestamp(value) == value.strftime("%Y-%m-%d %H:%M:%S")
+
+    def test_aware_datetime_matches_strftime(self):
+        value = datetime(2024, 1, 15, 10, 30, 5, 123456, tzinfo=timezone.utc)
+        assert _format_timestamp(value) == value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# ---------------------------------------------------------------------------
+# compare_snapshots
+# ---------------------------------------------------------------------------
+
+
+class TestCompareSnapshots:
+    def test_identical_snapshots_report_no_changes(self):
+        before = _snapshot([_account()], [_transaction()])
+        after = _snapshot([_account()], [_transaction()])
+
+        changes = compare_snapshots(before, after)
+
+        assert all(count == 0 for count in changes["summary"].values())
+
+    def test_added_and_removed_transactions(self):
+        before = _snapshot(transactions=[_transaction("tx-old", "Rent")])
+        after = _snapshot(transactions=[_transaction("tx-new", "Salary")])
+
+        changes = compare_snapshots(before, after)
+
+        assert changes["summary"]["transactions_added"] == 1
+        assert changes["summary"]["transactions_removed"] == 1
+        assert changes["transactions"]["added"][0]["guid"] == "tx-new"
+        assert changes["transactions"]["removed"][0]["guid"] == "tx-old"
+
+    def test_modified_account_detected(self):
+        before = _snapshot([_account(full_name="Assets:Checking")])
+        after = _snapshot([_account(full_name="Assets:Savings")])
+
+        changes = compare_snapshots(before, after)
+
+        assert changes["summary"]["accounts_modified"] == 1
+        modified = changes["accounts"]["modified"][0]
+        assert modified["before"]["full_name"] == "Assets:Checking"
+        assert modified["after"]["full_name"] == "Assets:Savings"
+
+    def test_modified_transaction_detected(self):
+        before = _snapshot(transactions=[_transaction(value=10.0)])
+        after = _snapshot(transactions=[_transaction(value=12.5)])
+
+        changes = compare_snapshots(before, after)
+
+        assert changes["summary"]["transactions_modified"] == 1
+
+    def test_fixed_transaction_detected(self):
+        before = _snapshot(transactions=[_transaction(error="post_date: bad")])
+        after = _snapshot(transactions=[_transaction()])
+
+        changes = compare_snapshots(before, after)
+
+        assert changes["summary"]["transactions_fixed"] == 1
+        fix = changes["transactions"]["fixed"][0]
+        assert fix["fix_summary"]["error_resolved"] == "post_date: bad"
+
+    def test_broken_transaction_detected(self):
+        before = _snapshot(transactions=[_transaction()])
+        after = _snapshot(transactions=[_transaction(error="splits: bad")])
+
+        changes = compare_snapshots(before, after)
+
+        assert changes["summary"]["transactions_broken"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Save / load
+# ---------------------------------------------------------------------------
+
+
+class TestSaveLoad:
+    def test_round_trip_preserves_records(self, tmp_path):
+        snapshot = _snapshot([_account()], [_transaction()])
+        snapshot.metadata["account_count"] = 1
+        snapshot.metadata["transaction_count"] = 1
+        path = tmp_path / "snapshot.json"
+
+        snapshot.save(path)
+        loaded = DatabaseSnapshot.load(path)
+
+        assert loaded.timestamp == snapshot.timestamp
+        assert loaded.metadata == snapshot.metadata
+        assert loaded.accounts == snapshot.accounts
+        assert loaded.transactions == snapshot.transactions
+
+    def test_loaded_snapshot_compares_equal_to_original(self, tmp_path):
+        snapshot = _snapshot([_account()], [_transaction()])
+        path = tmp_path / "snapshot.json"
+
+        snapshot.save(path)
+        changes = compare_snapshots(snapshot, DatabaseSnapshot.load(path))
+
+        assert all(count == 0 for count in changes["summary"].values())
+
+    def test_saved_layout_matches_whole_document_encoding(self, tmp_path):
+        snapshot = _snapshot([_account()], [_transaction()])
+        path = tmp_path / "snapshot.json"
+
+        snapshot.save(path)
+
+        expected = json.dumps(
+            json.loads(path.read_text(encoding="utf-8")), indent=2, ensure_ascii=False
+        )
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_empty_snapshot_round_trips(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+
+        DatabaseSnapshot().save(path)
+        loaded = DatabaseSnapshot.load(path)
+
+        assert loaded.accounts == {}
+        assert loaded.transactions == {}
+
+
+class TestSnapshotPayloadsIdentical:
+    def _save_pair(self, tmp_path, before, after):
+        first, second = tmp_path / "before.json", tmp_path / "after.json"
+        before.timestamp = "2024-01-15T10:30:00.000001"
+        after.timestamp = "2024-01-15T11:45:00.000002"
+        before.save(first)
+        after.save(second)
+        return first, second
+
+    def test_same_records_with_different_timestamps_are_identical(self, tmp_path):
+        first, second = self._save_pair(
+            tmp_path,
+            _snapshot([_account()], [_transaction()]),
+            _snapshot([_account()], [_transaction()]),
+        )
+
+        assert first.read_bytes() != second.read_bytes()
+        assert snapshot_payloads_identical(first, second)
+
+    def test_same_size_different_records_are_not_identical(self, tmp_path):
+        first, second = self._save_pair(
+            tmp_path,
+            _snapshot([_account()], [_transaction(value=10.0)]),
+            _snapshot([_account()], [_transaction(value=20.0)]),
+        )
+
+        assert first.stat().st_size == second.stat().st_size
+        assert not snapshot_payloads_identical(first, second)
+
+    def test_different_sizes_are_not_identical(self, tmp_path):
+        first, second = self._save_pair(
+            tmp_path,
+            _snapshot([_account()], [_transaction()]),
+            _snapshot([_account()], [_transaction(description="Groceries and fuel")]),
+        )
+
+        assert not snapshot_payloads_identical(first, second)
+
+    def test_files_without_timestamp_line_compare_all_bytes(self, tmp_path):
+        first, second = tmp_path / "a.json", tmp_path / "b.json"
+        first.write_bytes(b'{"timestamp": "T1"}')
+        second.write_bytes(b'{"timestamp": "T2"}')
+
+        assert not snapshot_payloads_identical(first, second)
+        assert read_snapshot_timestamp(first) is None
+
+    def test_read_snapshot_timestamp(self, tmp_path):
+        snapshot = _snapshot([_account()], [_transaction()])
+        path = tmp_path / "snapshot.json"
+        snapshot.save(path)
+
+        assert read_snapshot_timestamp(path) == snapshot.timestamp
+
+
+# ---------------------------------------------------------------------------
+# format_comparison_text
+# ---------------------------------------------------------------------------
+
+
+class TestFormatComparisonText:
+    def test_report_lists_fixed_transaction(self):
+        before = _snapshot(transactions=[_transaction(error="post_date: bad")])
+        after = _snapshot(transactions=[_transaction()])
+
+        text = format_comparison_text(compare_snapshots(before, after))
+
+        assert "FIXED TRANSACTIONS (1)" in text
+        assert "Groceries" in text